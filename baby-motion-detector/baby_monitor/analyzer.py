@@ -1,18 +1,32 @@
 from __future__ import annotations
 
 import asyncio
+import concurrent.futures
 import contextlib
+import dataclasses
+import functools
+import itertools
 import json
 import logging
+import math
+import multiprocessing
+import multiprocessing.util
+import os
+import queue
+import random
 import ssl
+import threading
 import time
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
 from typing import Optional
-import uuid
 
+import cv2
+import numpy as np
 import websockets
 from aiortc import (
     RTCConfiguration,
+    RTCIceCandidate,
     RTCPeerConnection,
     RTCSessionDescription,
 )
@@ -23,7 +37,143 @@ from websockets import WebSocketClientProtocol
 
 from .audio import AudioAnalyzer
 from .config import AnalyzerConfig
-from .pose import PoseAnalyzer
+from .pose import PoseAnalyzer, PoseExtras, PoseObservation
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is optional
+    orjson = None
+
+# Signaling messages are encoded to str: the relay and the web clients
+# expect text frames. orjson.JSONDecodeError subclasses json's.
+if orjson is not None:
+
+    def _json_dumps(obj) -> str:
+        return orjson.dumps(obj).decode()
+
+    _json_loads = orjson.loads
+else:
+    _json_dumps = functools.partial(json.dumps, separators=(",", ":"))
+    _json_loads = json.loads
+
+# Reconnect backoff bounds (seconds) for the signaling WebSocket.
+_RECONNECT_MIN_DELAY = 1.0
+_RECONNECT_MAX_DELAY = 32.0
+
+# Restart backoff bounds (seconds) for a crashed or failed pose worker.
+_POSE_RESTART_INITIAL_DELAY = 1.0
+_POSE_RESTART_MAX_DELAY = 60.0
+
+# Postures that count towards wake detection.
+_WAKE_POSTURES = frozenset(("sitting", "standing"))
+
+# The landmarker resizes its input to 256x256 internally, so larger frames
+# only cost conversion and transfer time: shrink them to this short edge.
+_POSE_INPUT_SHORT_EDGE = 384
+
+# Audio frames buffered between receive and analysis (about one second of
+# 20 ms frames); the oldest are dropped once analysis falls further behind.
+_AUDIO_QUEUE_FRAMES = 50
+# Minimum interval (seconds) between "analysis lagging" warnings.
+_AUDIO_SKIP_LOG_INTERVAL = 10.0
+
+_SNAPSHOT_JPEG_PARAMS = [cv2.IMWRITE_JPEG_QUALITY, 80, cv2.IMWRITE_JPEG_OPTIMIZE, 0]
+
+# PoseAnalyzer owned by the pose worker process (see _init_pose_worker).
+_worker_pose_analyzer: Optional[PoseAnalyzer] = None
+
+
+def _init_pose_worker(cpus: list[int]) -> None:
+    """Create the PoseAnalyzer inside the dedicated pose worker process."""
+    global _worker_pose_analyzer
+    if cpus and hasattr(os, "sched_setaffinity"):
+        os.sched_setaffinity(0, cpus)
+    _worker_pose_analyzer = PoseAnalyzer()
+    multiprocessing.util.Finalize(None, _worker_pose_analyzer.close, exitpriority=10)
+
+
+def _signaling_ssl_context(config: AnalyzerConfig) -> Optional[ssl.SSLContext]:
+    if not config.signaling_url.startswith("wss://"):
+        return None
+    ssl_context = ssl.create_default_context()
+    if config.disable_ssl_verify:
+        ssl_context.check_hostname = False
+        ssl_context.verify_mode = ssl.CERT_NONE
+    # WebSocket upgrades are HTTP/1.1 only.
+    ssl_context.set_alpn_protocols(["http/1.1"])
+    return ssl_context
+
+
+@functools.lru_cache(maxsize=256)
+def _parse_candidate(candidate_sdp: str) -> RTCIceCandidate:
+    """Parse a remote candidate line, memoized for repeated candidates.
+
+    The cached instance is shared: copy it before setting sdpMid/sdpMLineIndex.
+    """
+    return candidate_from_sdp(candidate_sdp)
+
+
+def _frame_to_array(frame, short_edge: Optional[int] = None) -> np.ndarray:
+    """Extract the raw frame planes to ship to the pose worker.
+
+    Even-sized frames are sent as planar I420 (1.5 bytes per pixel, no
+    colorspace conversion on the event loop); the worker converts them.
+    With ``short_edge``, larger frames are downscaled in the same pass.
+    """
+    width, height = frame.width, frame.height
+    if short_edge and min(width, height) > short_edge:
+        scale = short_edge / min(width, height)
+        # Keep dimensions even so the I420 layout stays valid.
+        width = max(2, int(round(width * scale / 2)) * 2)
+        height = max(2, int(round(height * scale / 2)) * 2)
+    if width % 2 == 0 and height % 2 == 0:
+        return frame.to_ndarray(width=width, height=height, format="yuv420p")
+    return frame.to_ndarray(width=width, height=height, format="bgr24")
+
+
+def _frame_to_bgr(array: np.ndarray) -> np.ndarray:
+    if array.ndim == 2:
+        # Planar I420 payload (see _frame_to_array)
+        return cv2.cvtColor(array, cv2.COLOR_YUV2BGR_I420)
+    return array
+
+
+def _pose_process_frame(frame_array: np.ndarray) -> Optional[PoseObservation]:
+    assert _worker_pose_analyzer is not None
+    if frame_array.ndim == 2:
+        # Planar I420 payload: convert straight to RGB, skipping BGR.
+        return _worker_pose_analyzer.process_i420_frame(frame_array)
+    return _worker_pose_analyzer.process_frame(frame_array)
+
+
+def _pose_render_snapshot(frame_array: np.ndarray, pose_landmarks) -> bytes:
+    """Annotate the frame and encode it as JPEG inside the pose worker.
+
+    Only the compressed image travels back to the event loop process.
+    """
+    assert _worker_pose_analyzer is not None
+    # The BGR frame is private to this call (converted or unpickled here),
+    # so the skeleton can be drawn on it directly.
+    annotated = _worker_pose_analyzer.annotate_frame(
+        _frame_to_bgr(frame_array), pose_landmarks, inplace=True
+    )
+    ok, buffer = cv2.imencode(".jpg", annotated, _SNAPSHOT_JPEG_PARAMS)
+    if not ok:
+        raise RuntimeError("JPEG encoding failed")
+    return buffer.tobytes()
+
+
+def _describe_pose(extras: PoseExtras) -> tuple[str, str, str]:
+    """Format torso/knee/leg extras for event log lines."""
+    torso_angle = extras.torso_angle
+    avg_knee = extras.avg_knee_angle
+    leg_ext = extras.leg_extension
+    torso_text = (
+        f"torso={torso_angle:.1f}°" if not math.isnan(torso_angle) else "torso=n/a"
+    )
+    knee_text = f"{avg_knee:.1f}°" if not math.isnan(avg_knee) else "n/a"
+    leg_text = f"{leg_ext:.2f}" if not math.isnan(leg_ext) else "n/a"
+    return torso_text, knee_text, leg_text
 
 
 class AnalyzerClient:
@@ -33,19 +183,42 @@ class AnalyzerClient:
         self.config = config
         self._pc: Optional[RTCPeerConnection] = None
         self._ws: Optional[WebSocketClientProtocol] = None
+        # Built once: the CA bundle is loaded a single time and every
+        # reconnect reuses the same context.
+        self._ssl_context = _signaling_ssl_context(config)
+        self._join_message = _json_dumps(
+            {"type": "join", "room": config.room, "role": "viewer"}
+        )
         self._video_task: Optional[asyncio.Task] = None
+        self._video_frame_slot: asyncio.Queue = asyncio.Queue(maxsize=1)
+        self._pose_interval = 1.0 / config.pose_fps if config.pose_fps > 0 else 0.0
+        self._last_pose_ts: float = 0.0
         self._audio_task: Optional[asyncio.Task] = None
-        self._pose_analyzer = PoseAnalyzer()
+        self._audio_frame_queue: asyncio.Queue = asyncio.Queue(maxsize=_AUDIO_QUEUE_FRAMES)
+        self._pose_executor = self._create_pose_executor()
+        self._pose_restart_delay = _POSE_RESTART_INITIAL_DELAY
         self._audio_analyzer = AudioAnalyzer(
             config.audio_output_dir, record_audio=config.record_audio
         )
+        # Single worker: keeps frames ordered and the detector single-threaded.
+        self._audio_executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="audio-analyzer"
+        )
         self._current_posture: Optional[str] = None
         self._rejoin_lock = asyncio.Lock()
         self._stop_requested = False
         self._snapshot_enabled = config.snapshot_on_event
         self._snapshot_dir = Path(config.snapshot_dir)
+        # Snapshots are JPEG-encoded and written by a background thread so
+        # the video task never blocks on disk I/O.
+        self._snapshot_queue: queue.Queue = queue.Queue(maxsize=32)
+        self._snapshot_thread: Optional[threading.Thread] = None
         if self._snapshot_enabled:
             self._snapshot_dir.mkdir(parents=True, exist_ok=True)
+            self._snapshot_thread = threading.Thread(
+                target=self._snapshot_writer, name="snapshot-writer", daemon=True
+            )
+            self._snapshot_thread.start()
         self._event_cooldown = 2.0
         self._movement_cooldown = 2.0
         self._last_event_label: Optional[str] = None
@@ -55,52 +228,74 @@ class AnalyzerClient:
         self._wake_candidate_since: float = 0.0
         self._wake_min_duration = 3.0
         self._is_awake: bool = False
+        self._trace_counter = itertools.count()
+
+    def _create_pose_executor(self) -> concurrent.futures.ProcessPoolExecutor:
+        # Pose inference runs in its own process so MediaPipe never competes
+        # with the asyncio loop for the GIL. "spawn" avoids forking the
+        # aiortc/asyncio threads into the worker.
+        return concurrent.futures.ProcessPoolExecutor(
+            max_workers=1,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_pose_worker,
+            initargs=(self.config.pose_cpus,),
+        )
+
+    async def _restart_pose_executor(self, exc: BaseException) -> None:
+        """Replace a broken pose worker pool after an exponential backoff.
+
+        The pool breaks for good when the worker fails to initialize (model
+        download, MediaPipe import, CPU affinity) or dies; frames arriving
+        during the backoff are dropped by _consume_video.
+        """
+        delay = self._pose_restart_delay
+        logging.error("Pose worker unavailable (%s), restarting in %.0fs", exc, delay)
+        self._pose_executor.shutdown(wait=False, cancel_futures=True)
+        await asyncio.sleep(delay)
+        self._pose_restart_delay = min(delay * 2, _POSE_RESTART_MAX_DELAY)
+        self._pose_executor = self._create_pose_executor()
 
     async def run(self) -> None:
         """Start the signaling loop and keep running until shutdown is requested."""
-        ssl_context = None
-        if self.config.signaling_url.startswith("wss://"):
-            ssl_context = ssl.create_default_context()
-            if self.config.disable_ssl_verify:
-                ssl_context.check_hostname = False
-                ssl_context.verify_mode = ssl.CERT_NONE
         logging.info(
             "Connecting to signaling server %s (room=%s)",
             self.config.signaling_url,
             self.config.room,
         )
 
+        backoff = _RECONNECT_MIN_DELAY
         while not self._stop_requested:
             try:
                 async with websockets.connect(
-                    self.config.signaling_url, ssl=ssl_context
+                    self.config.signaling_url, ssl=self._ssl_context
                 ) as ws:
                     self._ws = ws
-                    await ws.send(
-                        json.dumps(
-                            {"type": "join", "room": self.config.room, "role": "viewer"}
-                        )
-                    )
+                    await ws.send(self._join_message)
                     await self._setup_peer_connection()
+                    backoff = _RECONNECT_MIN_DELAY
                     await self._signaling_loop()
             except websockets.exceptions.ConnectionClosed as exc:
                 if self._stop_requested:
                     logging.info("WebSocket closed while stopping: %s", exc)
                     break
-                logging.warning("WebSocket closed (%s), retrying in 2s...", exc)
-                await asyncio.sleep(2)
-                continue
+                reason = f"WebSocket closed ({exc})"
             except Exception:
                 if self._stop_requested:
                     break
-                logging.exception("Unexpected client error, retrying in 2s")
-                await asyncio.sleep(2)
-                continue
+                logging.exception("Unexpected client error")
+                reason = "Client error"
+            else:
+                reason = "Main loop ended"
             finally:
                 self._ws = None
-            if not self._stop_requested:
-                logging.warning("Main loop ended, reconnecting in 2s...")
-                await asyncio.sleep(2)
+            if self._stop_requested:
+                break
+            # Exponential backoff (1, 2, 4 ... 32s) with +/-25% jitter so
+            # clients don't reconnect in lock-step while the server is flapping.
+            delay = backoff * random.uniform(0.75, 1.25)
+            logging.warning("%s, reconnecting in %.1fs...", reason, delay)
+            await asyncio.sleep(delay)
+            backoff = min(backoff * 2, _RECONNECT_MAX_DELAY)
 
         logging.info("Main loop stopped")
 
@@ -128,7 +323,7 @@ class AnalyzerClient:
                     candidate.sdpMid,
                     candidate.sdpMLineIndex,
                 )
-                await self._ws.send(json.dumps(payload))
+                await self._ws.send(_json_dumps(payload))
 
         @self._pc.on("iceconnectionstatechange")
         async def on_ice_state_change() -> None:
@@ -163,7 +358,7 @@ class AnalyzerClient:
         try:
             async for raw in self._ws:
                 try:
-                    message = json.loads(raw)
+                    message = _json_loads(raw)
                 except json.JSONDecodeError:
                     logging.warning("Invalid JSON message: %s", raw)
                     continue
@@ -173,7 +368,12 @@ class AnalyzerClient:
                     if msg_type == "offer":
                         await self._handle_offer(message)
                     elif msg_type == "candidate":
-                        await self._handle_remote_candidate(message)
+                        await self._handle_remote_candidate(message.get("candidate"))
+                    elif msg_type == "candidates":
+                        # Candidates the broadcaster gathered in a burst,
+                        # coalesced into one message.
+                        for candidate_dict in message.get("candidates") or ():
+                            await self._handle_remote_candidate(candidate_dict)
                     elif msg_type == "peer-left":
                         logging.info("Broadcaster disconnected (%s)", message.get("peerId"))
                         await self._reset()
@@ -205,24 +405,23 @@ class AnalyzerClient:
         logging.info("Offer SDP received (%d bytes)", len(rtc_offer.sdp or ""))
         answer = await self._pc.createAnswer()
         await self._pc.setLocalDescription(answer)
-        logging.info(
-            "Answer SDP generated (%d bytes)",
-            len(self._pc.localDescription.sdp or ""),
-        )
+        local = self._pc.localDescription
+        local_sdp = local.sdp or ""
+        from_id = message.get("fromId")
+        logging.info("Answer SDP generated (%d bytes)", len(local_sdp))
         payload = {
             "type": "answer",
             "answer": {
-                "type": self._pc.localDescription.type,
-                "sdp": self._pc.localDescription.sdp,
+                "type": local.type,
+                "sdp": local.sdp,
             },
-            "targetId": message.get("fromId"),
+            "targetId": from_id,
         }
-        await self._ws.send(json.dumps(payload))
-        logging.info("Answer sent to broadcaster (targetId=%s)", message.get("fromId"))
+        await self._ws.send(_json_dumps(payload))
+        logging.info("Answer sent to broadcaster (targetId=%s)", from_id)
 
-    async def _handle_remote_candidate(self, message: dict) -> None:
+    async def _handle_remote_candidate(self, candidate_dict: Optional[dict]) -> None:
         assert self._pc is not None
-        candidate_dict = message.get("candidate")
         if candidate_dict is None:
             await self._pc.addIceCandidate(None)
             return
@@ -236,9 +435,11 @@ class AnalyzerClient:
             return
 
         try:
-            candidate = candidate_from_sdp(candidate_sdp)
-            candidate.sdpMid = candidate_dict.get("sdpMid")
-            candidate.sdpMLineIndex = candidate_dict.get("sdpMLineIndex")
+            candidate = dataclasses.replace(
+                _parse_candidate(candidate_sdp),
+                sdpMid=candidate_dict.get("sdpMid"),
+                sdpMLineIndex=candidate_dict.get("sdpMLineIndex"),
+            )
             await self._pc.addIceCandidate(candidate)
             logging.info(
                 "Added remote candidate (mid=%s, index=%s)",
@@ -251,65 +452,136 @@ class AnalyzerClient:
     async def _consume_video(self, track) -> None:
         frame_count = 0
         first_frame_logged = False
-        while True:
-            try:
-                frame = await track.recv()
-            except MediaStreamError as exc:  # pragma: no cover - depends on aiortc
-                logging.info("Video track ended (%s)", exc)
-                break
-            except Exception:
-                logging.exception("Error while receiving video")
-                break
+        # Drop any frame left over from a previous track.
+        while not self._video_frame_slot.empty():
+            self._video_frame_slot.get_nowait()
+        analysis_task = asyncio.create_task(self._analyze_video())
+        try:
+            while True:
+                try:
+                    frame = await track.recv()
+                except MediaStreamError as exc:  # pragma: no cover - depends on aiortc
+                    logging.info("Video track ended (%s)", exc)
+                    break
+                except Exception:
+                    logging.exception("Error while receiving video")
+                    break
 
-            frame_count += 1
-            if not first_frame_logged:
-                logging.info(
-                    "Video track: first frame received (pts=%s, time=%s)",
-                    frame.pts,
-                    frame.time,
-                )
-                first_frame_logged = True
+                frame_count += 1
+                if not first_frame_logged:
+                    logging.info(
+                        "Video track: first frame received (pts=%s, time=%s)",
+                        frame.pts,
+                        frame.time,
+                    )
+                    first_frame_logged = True
+
+                # Keep only the latest frame so a slow pose analysis never
+                # backs up the receive loop (drop-oldest).
+                if self._video_frame_slot.full():
+                    self._video_frame_slot.get_nowait()
+                self._video_frame_slot.put_nowait(frame)
+        finally:
+            analysis_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await analysis_task
 
-            frame_bgr = frame.to_ndarray(format="bgr24")
+    async def _analyze_video(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            frame = await self._video_frame_slot.get()
+            # Wake/movement cooldowns span seconds, so a few analysed frames
+            # per second are enough; skip the rest before any conversion. The
+            # movement score is a speed, so it does not depend on this rate.
+            now = time.monotonic()
+            if now - self._last_pose_ts < self._pose_interval:
+                continue
+            self._last_pose_ts = now
+            # Only the (downscaled) plane copy happens here: the array is
+            # pickled by the executor's feeder thread and converted to BGR in
+            # the worker. A new frame is not sent until this one is analysed;
+            # frames arriving meanwhile are dropped by _consume_video.
+            frame_array = _frame_to_array(frame, _POSE_INPUT_SHORT_EDGE)
             try:
-                observation = await asyncio.get_running_loop().run_in_executor(
-                    None, self._pose_analyzer.process_frame, frame_bgr
+                observation = await loop.run_in_executor(
+                    self._pose_executor, _pose_process_frame, frame_array
                 )
+            except BrokenProcessPool as exc:
+                await self._restart_pose_executor(exc)
+                continue
             except Exception:
                 logging.exception("Pose analysis error")
                 continue
+            self._pose_restart_delay = _POSE_RESTART_INITIAL_DELAY
             if not observation:
                 continue
 
             events = self._handle_pose_observation(observation)
             if self._snapshot_enabled and events:
+                # Landmarks are normalized, so snapshots are drawn on the
+                # full-resolution frame.
+                snapshot_array = _frame_to_array(frame)
                 for event in events:
-                    self._save_snapshot(frame_bgr, observation, event)
+                    await self._save_snapshot(snapshot_array, observation, event)
 
     async def _consume_audio(self, track) -> None:
         frame_count = 0
         first_frame_logged = False
-        while True:
-            try:
-                frame = await track.recv()
-            except MediaStreamError as exc:  # pragma: no cover
-                logging.info("Audio track ended (%s)", exc)
-                break
-            except Exception:
-                logging.exception("Error while receiving audio")
-                break
+        skipped = 0
+        last_skip_log = -_AUDIO_SKIP_LOG_INTERVAL
+        # Drop any frame left over from a previous track.
+        while not self._audio_frame_queue.empty():
+            self._audio_frame_queue.get_nowait()
+        analysis_task = asyncio.create_task(self._analyze_audio())
+        try:
+            while True:
+                try:
+                    frame = await track.recv()
+                except MediaStreamError as exc:  # pragma: no cover
+                    logging.info("Audio track ended (%s)", exc)
+                    break
+                except Exception:
+                    logging.exception("Error while receiving audio")
+                    break
 
-            frame_count += 1
-            if not first_frame_logged:
-                logging.info(
-                    "Audio track: first packet received (pts=%s, samples=%s)",
-                    frame.pts,
-                    frame.samples,
-                )
-                first_frame_logged = True
+                frame_count += 1
+                if not first_frame_logged:
+                    logging.info(
+                        "Audio track: first packet received (pts=%s, samples=%s)",
+                        frame.pts,
+                        frame.samples,
+                    )
+                    first_frame_logged = True
+
+                # Receiving never waits for analysis; if analysis lags by
+                # more than the queue holds, the oldest frame skips cry
+                # detection. It is still recorded, on the audio thread and
+                # ahead of every frame still queued, so the WAV has no gaps.
+                if self._audio_frame_queue.full():
+                    dropped = self._audio_frame_queue.get_nowait()
+                    self._audio_executor.submit(self._audio_analyzer.record_frame, dropped)
+                    skipped += 1
+                    now = time.monotonic()
+                    if now - last_skip_log >= _AUDIO_SKIP_LOG_INTERVAL:
+                        logging.warning(
+                            "Audio analysis lagging, %d frame(s) not analysed", skipped
+                        )
+                        skipped = 0
+                        last_skip_log = now
+                self._audio_frame_queue.put_nowait(frame)
+        finally:
+            analysis_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await analysis_task
 
+    async def _analyze_audio(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            frame = await self._audio_frame_queue.get()
             try:
-                event = self._audio_analyzer.process_frame(frame)
+                event = await loop.run_in_executor(
+                    self._audio_executor, self._audio_analyzer.process_frame, frame
+                )
             except Exception:
                 logging.exception("Audio analysis error")
                 continue
@@ -323,37 +595,42 @@ class AnalyzerClient:
     def _handle_pose_observation(self, observation) -> list[dict]:
         events: list[dict] = []
         posture = observation.posture
-        now = time.time()
-        extras = observation.extras or {}
-        torso_angle = extras.get("torso_angle")
-        avg_knee = extras.get("avg_knee_angle")
-        leg_ext = extras.get("leg_extension")
-        torso_text = (
-            f"torso={torso_angle:.1f}°" if torso_angle is not None else "torso=n/a"
-        )
-        knee_text = f"{avg_knee:.1f}°" if avg_knee is not None else "n/a"
-        leg_text = f"{leg_ext:.2f}" if leg_ext is not None else "n/a"
+        now = time.monotonic()
+        movement_due = observation.movement_detected and (
+            now - self._last_movement_event_ts
+        ) >= self._movement_cooldown
+
+        # Steady state (same posture, no movement event possible, wake state
+        # machine settled): nothing below can emit an event or change state.
+        if (
+            not movement_due
+            and posture == self._current_posture
+            and (self._is_awake or posture not in _WAKE_POSTURES)
+        ):
+            return events
+
+        extras = observation.extras
 
         # Movement detection with cooldown
-        if observation.movement_detected and (
-            now - self._last_movement_event_ts
-        ) >= self._movement_cooldown:
-            trace_id = uuid.uuid4().hex[:8]
-            logging.info(
-                "Trace %s – Movement detected (score=%.3f, posture=%s, %s, knee=%s, leg=%s)",
-                trace_id,
-                observation.movement_score,
-                posture,
-                torso_text,
-                knee_text,
-                leg_text,
-            )
+        if movement_due:
+            trace_id = self._next_trace_id()
+            if logging.getLogger().isEnabledFor(logging.INFO):
+                torso_text, knee_text, leg_text = _describe_pose(extras)
+                logging.info(
+                    "Trace %s – Movement detected (score=%.3f, posture=%s, %s, knee=%s, leg=%s)",
+                    trace_id,
+                    observation.movement_score,
+                    posture,
+                    torso_text,
+                    knee_text,
+                    leg_text,
+                )
             payload = {
                 "trace_id": trace_id,
                 "label": "movement",
                 "description": "movement",
                 "extras": {
-                    **extras,
+                    **extras.as_dict(),
                     "movement_score": observation.movement_score,
                     "posture": posture,
                 },
@@ -363,7 +640,7 @@ class AnalyzerClient:
                 self._last_movement_event_ts = now
 
         # Wake detection (sitting or standing maintained for >= 3s)
-        if posture in {"sitting", "standing"}:
+        if posture in _WAKE_POSTURES:
             if self._is_awake:
                 self._wake_candidate_posture = None
             else:
@@ -371,23 +648,25 @@ class AnalyzerClient:
                     self._wake_candidate_posture = posture
                     self._wake_candidate_since = now
                 elif (now - self._wake_candidate_since) >= self._wake_min_duration:
-                    trace_id = uuid.uuid4().hex[:8]
+                    trace_id = self._next_trace_id()
                     duration = now - self._wake_candidate_since
-                    logging.info(
-                        "Trace %s – Wake detected (posture=%s, duration=%.1fs, %s, knee=%s, leg=%s)",
-                        trace_id,
-                        posture,
-                        duration,
-                        torso_text,
-                        knee_text,
-                        leg_text,
-                    )
+                    if logging.getLogger().isEnabledFor(logging.INFO):
+                        torso_text, knee_text, leg_text = _describe_pose(extras)
+                        logging.info(
+                            "Trace %s – Wake detected (posture=%s, duration=%.1fs, %s, knee=%s, leg=%s)",
+                            trace_id,
+                            posture,
+                            duration,
+                            torso_text,
+                            knee_text,
+                            leg_text,
+                        )
                     payload = {
                         "trace_id": trace_id,
                         "label": "wake",
                         "description": f"wake ({posture})",
                         "extras": {
-                            **extras,
+                            **extras.as_dict(),
                             "posture": posture,
                             "duration": duration,
                         },
@@ -404,6 +683,9 @@ class AnalyzerClient:
         self._current_posture = posture
         return events
 
+    def _next_trace_id(self) -> str:
+        return f"{next(self._trace_counter):08x}"
+
     async def _reset(self) -> None:
         if self._video_task:
             self._video_task.cancel()
@@ -419,7 +701,10 @@ class AnalyzerClient:
             await self._pc.close()
             self._pc = None
         self._current_posture = None
-        self._audio_analyzer.close()
+        # Close on the audio thread so it cannot race an in-flight frame.
+        await asyncio.get_running_loop().run_in_executor(
+            self._audio_executor, self._audio_analyzer.close
+        )
         logging.info("Client state reset.")
 
     async def _attempt_rejoin(self, reason: str) -> None:
@@ -436,11 +721,7 @@ class AnalyzerClient:
             logging.warning("Connection lost (%s) – attempting to rejoin", reason)
             await self._reset()
             try:
-                await self._ws.send(
-                    json.dumps(
-                        {"type": "join", "room": self.config.room, "role": "viewer"}
-                    )
-                )
+                await self._ws.send(self._join_message)
                 await self._setup_peer_connection()
             except websockets.exceptions.ConnectionClosed:
                 logging.warning("Cannot re-send join: WS already closed")
@@ -451,35 +732,68 @@ class AnalyzerClient:
         if self._ws:
             await self._ws.close()
             self._ws = None
-        self._pose_analyzer.close()
-        self._audio_analyzer.close()
+        self._pose_executor.shutdown(wait=False, cancel_futures=True)
+        self._audio_executor.shutdown(wait=True)
+        if self._snapshot_thread is not None:
+            # Let the writer flush pending snapshots before exiting.
+            self._snapshot_queue.put(None)
+            await asyncio.get_running_loop().run_in_executor(
+                None, self._snapshot_thread.join
+            )
+            self._snapshot_thread = None
 
-    def _save_snapshot(self, frame_bgr, observation, event: dict) -> None:
+    async def _save_snapshot(
+        self, frame_array: np.ndarray, observation, event: dict
+    ) -> None:
         if observation.pose_landmarks is None:
             return
-        annotated = self._pose_analyzer.annotate_frame(frame_bgr, observation.pose_landmarks)
-        from datetime import datetime
-
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
-        label = event.get("label", "event").replace(" ", "_")
         trace_id = event.get("trace_id", "trace")
-        filename = self._snapshot_dir / f"snapshot_{timestamp}_{label}_{trace_id}.jpg"
         try:
-            import cv2
-
-            cv2.imwrite(str(filename), annotated)
-            desc = event.get("description") or event.get("label")
-            logging.info(
-                "Trace %s – Annotated snapshot (%s) saved: %s",
-                trace_id,
-                desc,
-                filename,
+            jpeg = await asyncio.get_running_loop().run_in_executor(
+                self._pose_executor,
+                _pose_render_snapshot,
+                frame_array,
+                observation.pose_landmarks,
             )
+        except BrokenProcessPool:
+            # _analyze_video restarts the worker on its next frame.
+            logging.warning("Trace %s – Pose worker unavailable, no snapshot", trace_id)
+            return
         except Exception:
-            logging.exception(
-                "Trace %s – Failed to save annotated snapshot", trace_id
+            logging.exception("Trace %s – Failed to render snapshot", trace_id)
+            return
+        now = time.time()
+        timestamp = time.strftime("%Y%m%d_%H%M%S", time.localtime(now))
+        timestamp = f"{timestamp}_{int((now % 1) * 1e6):06d}"
+        label = event.get("label", "event").replace(" ", "_")
+        filename = self._snapshot_dir / f"snapshot_{timestamp}_{label}_{trace_id}.jpg"
+        desc = event.get("description") or event.get("label")
+        try:
+            self._snapshot_queue.put_nowait((filename, jpeg, trace_id, desc))
+        except queue.Full:
+            logging.warning(
+                "Trace %s – Snapshot queue full, dropping snapshot", trace_id
             )
 
+    def _snapshot_writer(self) -> None:
+        while True:
+            item = self._snapshot_queue.get()
+            if item is None:
+                return
+            filename, jpeg, trace_id, desc = item
+            try:
+                filename.write_bytes(jpeg)
+                logging.info(
+                    "Trace %s – Annotated snapshot (%s) saved: %s",
+                    trace_id,
+                    desc,
+                    filename,
+                )
+            except Exception:
+                logging.exception(
+                    "Trace %s – Failed to save annotated snapshot", trace_id
+                )
+
     def _register_event(self, event: dict, timestamp: float) -> bool:
         label = event.get("label")
         if not label:
@@ -491,5 +805,5 @@ class AnalyzerClient:
             return False
         self._last_event_label = label
         self._last_event_ts = timestamp
-        event.setdefault("extras", {})["event_timestamp"] = timestamp
+        event.setdefault("extras", {})["event_timestamp"] = time.time()
         return True
@@ -7,7 +7,21 @@ from pathlib import Path
 from typing import Optional
 
 import numpy as np
-from scipy.signal import welch
+from numpy.lib.stride_tricks import sliding_window_view
+
+# Lowest sample rate the cry band analysis is decimated to (Hz).
+_DECIMATED_MIN_RATE = 6000
+
+
+def _periodic_hann(size: int) -> np.ndarray:
+    return (0.5 - 0.5 * np.cos(2.0 * np.pi * np.arange(size) / size)).astype(np.float32)
+
+
+def _lowpass_fir(numtaps: int, cutoff: float) -> np.ndarray:
+    """Hamming-windowed sinc low-pass; ``cutoff`` is relative to Nyquist."""
+    n = np.arange(numtaps) - (numtaps - 1) / 2
+    taps = cutoff * np.sinc(cutoff * n) * np.hamming(numtaps)
+    return (taps / taps.sum()).astype(np.float32)
 
 
 @dataclass
@@ -39,45 +53,135 @@ class CryDetector:
         self.hop_size = int(sample_rate * hop_seconds)
         self.energy_threshold = energy_threshold
         self.band_ratio_threshold = band_ratio_threshold
-        self._buffer = np.empty(0, dtype=np.float32)
+        # Samples are appended in place; the buffer only grows if a caller
+        # pushes more than a hop beyond a full window at once.
+        self._buffer = np.empty(self.window_size + self.hop_size, dtype=np.float32)
+        self._fill = 0
+        # Welch's method with a periodic Hann window and 50% overlap,
+        # precomputed once: the cry band maps to a fixed slice of the bins.
+        self._nperseg = min(1024, self.window_size)
+        self._step = self._nperseg - self._nperseg // 2
+        self._hann = _periodic_hann(self._nperseg)
+        self._hann_scale = float(np.sum(self._hann, dtype=np.float64)) ** 2
+        # The cry band sits far below Nyquist, so the band spectrum is taken
+        # on a low-passed signal decimated to about 6 kHz. Segments keep the
+        # same duration, hence the same bins and close PSD values.
+        self._decimation = 1
+        while (
+            sample_rate // (2 * self._decimation) >= _DECIMATED_MIN_RATE
+            and self._nperseg % (2 * self._decimation) == 0
+            and self._step % (2 * self._decimation) == 0
+            and self.hop_size % (2 * self._decimation) == 0
+        ):
+            self._decimation *= 2
+        self._antialias = _lowpass_fir(8 * self._decimation + 1, 1.0 / self._decimation)
+        # Consecutive windows overlap, so pending samples are filtered once
+        # and each window is a slice of the decimated signal.
+        self._band_window = (self.window_size - self._antialias.size) // self._decimation + 1
+        if self._decimation == 1:
+            self._band_window = self.window_size
+        self._band_hop = self.hop_size // self._decimation
+        band_nperseg = self._nperseg // self._decimation
+        self._band_nperseg = band_nperseg
+        self._band_step = self._step // self._decimation
+        self._band_hann = _periodic_hann(band_nperseg)
+        freqs = np.fft.rfftfreq(band_nperseg, d=self._decimation / sample_rate)
+        self._band_lo = int(np.searchsorted(freqs, 400.0, side="left"))
+        self._band_hi = int(np.searchsorted(freqs, 1500.0, side="right"))
+        # One-sided spectrum: every bin but DC (and Nyquist) counts twice.
+        band_weights = np.full(band_nperseg // 2 + 1, 2.0)
+        band_weights[0] = 1.0
+        if band_nperseg % 2 == 0:
+            band_weights[-1] = 1.0
+        band_weights /= float(np.sum(self._band_hann, dtype=np.float64)) ** 2
+        self._band_weights = band_weights[self._band_lo : self._band_hi]
 
     def process_samples(self, samples: np.ndarray) -> Optional[CryEvent]:
         """
         Append mono float32 samples and return a CryEvent if a cry is detected.
         """
-        self._buffer = np.concatenate((self._buffer, samples))
-        while self._buffer.size >= self.window_size:
-            window = self._buffer[: self.window_size]
-            self._buffer = self._buffer[self.hop_size :]
-            if event := self._detect(window):
-                return event
-        return None
-
-    def _detect(self, window: np.ndarray) -> Optional[CryEvent]:
-        energy = float(np.mean(window**2))
-        if energy < self.energy_threshold:
+        end = self._fill + samples.size
+        if end > self._buffer.size:
+            grown = np.empty(end, dtype=np.float32)
+            grown[: self._fill] = self._buffer[: self._fill]
+            self._buffer = grown
+        self._buffer[self._fill : end] = samples
+        self._fill = end
+        if self._fill < self.window_size:
             return None
+        # Every full window pending in the buffer (several after a burst) is
+        # analysed in one batch; the buffer then slides past the windows
+        # consumed, stopping right after the first detection.
+        count = 1 + (self._fill - self.window_size) // self.hop_size
+        pending = self._buffer[: (count - 1) * self.hop_size + self.window_size]
+        index, event = self._detect(pending)
+        consumed = (count if event is None else index + 1) * self.hop_size
+        remaining = self._fill - consumed
+        self._buffer[:remaining] = self._buffer[consumed : self._fill]
+        self._fill = remaining
+        return event
 
-        freqs, psd = welch(
-            window,
-            fs=self.sample_rate,
-            nperseg=min(1024, self.window_size),
-            scaling="spectrum",
-        )
-        total_energy = float(np.sum(psd))
-        if total_energy <= 1e-8:
-            return None
+    def _total_power(self, windows: np.ndarray) -> np.ndarray:
+        """Total Welch power of each window row, via Parseval (no FFT)."""
+        segments = sliding_window_view(windows, self._nperseg, axis=-1)[:, :: self._step]
+        segments = segments - segments.mean(axis=-1, keepdims=True)
+        segments *= self._hann
+        total = np.einsum("ksn,ksn->k", segments, segments)
+        return total * (self._nperseg / self._hann_scale / segments.shape[1])
 
-        band_mask = (freqs >= 400.0) & (freqs <= 1500.0)
-        ratio_mid_band = float(np.sum(psd[band_mask]) / total_energy)
+    def _band_power(self, signal: np.ndarray, rows: np.ndarray) -> np.ndarray:
+        """Cry-band Welch power of the windows ``rows`` of ``signal``.
 
-        if ratio_mid_band > self.band_ratio_threshold:
-            return CryEvent(
-                timestamp=time.time(),
-                energy=energy,
-                ratio_mid_band=ratio_mid_band,
-            )
-        return None
+        The band spectrum is taken from the decimated signal with one batched
+        FFT. Within the low-pass passband the values approximate
+        ``scipy.signal.welch(..., scaling="spectrum")`` at the full rate: the
+        band ratio stays within about 1% of the total power (see
+        tests/test_audio.py).
+        """
+        if self._decimation > 1:
+            taps = sliding_window_view(signal, self._antialias.size)
+            signal = taps[:: self._decimation] @ self._antialias
+        windows = sliding_window_view(signal, self._band_window)[:: self._band_hop][rows]
+        segments = sliding_window_view(windows, self._band_nperseg, axis=-1)
+        segments = segments[:, :: self._band_step]
+        segments = segments - segments.mean(axis=-1, keepdims=True)
+        segments *= self._band_hann
+        spectrum = np.fft.rfft(segments, axis=-1)[..., self._band_lo : self._band_hi]
+        power = (spectrum.real**2 + spectrum.imag**2).mean(axis=1)
+        return power @ self._band_weights
+
+    def _detect(self, signal: np.ndarray) -> tuple[int, Optional[CryEvent]]:
+        """Analyse every hop-spaced window of ``signal`` in one batch.
+
+        Returns the index of the first window flagged as a cry and its event,
+        or ``(-1, None)``.
+        """
+        windows = sliding_window_view(signal, self.window_size)[:: self.hop_size]
+        energies = np.einsum("ij,ij->i", windows, windows) / self.window_size
+        candidates = np.flatnonzero(energies >= self.energy_threshold)
+        if candidates.size == 0:
+            return -1, None
+
+        total_energy = self._total_power(windows[candidates])
+        band_energy = self._band_power(signal, candidates)
+        valid = total_energy > 1e-8
+        ratio_mid_band = np.divide(
+            band_energy, total_energy, out=np.zeros_like(total_energy), where=valid
+        )
+        # The decimated band power is approximate (FIR passband ripple), so
+        # a pure in-band signal can slightly exceed the total: clamp.
+        np.clip(ratio_mid_band, 0.0, 1.0, out=ratio_mid_band)
+
+        hits = np.flatnonzero(valid & (ratio_mid_band > self.band_ratio_threshold))
+        if hits.size == 0:
+            return -1, None
+        first = hits[0]
+        index = int(candidates[first])
+        return index, CryEvent(
+            timestamp=time.time(),
+            energy=float(energies[index]),
+            ratio_mid_band=float(ratio_mid_band[first]),
+        )
 
 
 class AudioAnalyzer:
@@ -94,8 +198,15 @@ class AudioAnalyzer:
         if self.record_audio:
             self.output_dir.mkdir(parents=True, exist_ok=True)
         self._wave_file: Optional[wave.Wave_write] = None
+        # PCM waiting to be written; flushed about once per second.
+        self._wave_buffer = bytearray()
+        self._wave_flush_bytes = 0
         self._detector: Optional[CryDetector] = None
         self._last_cry_ts: float = 0.0
+        # Reused for the stereo downmix and the int16 -> float conversion.
+        self._mix_scratch = np.empty(0, dtype=np.int32)
+        self._pcm_scratch = np.empty(0, dtype=np.int16)
+        self._float_scratch = np.empty(0, dtype=np.float32)
         self._cry_cooldown = cry_cooldown
 
     def ensure_writer(self, sample_rate: int) -> None:
@@ -108,15 +219,12 @@ class AudioAnalyzer:
         self._wave_file.setnchannels(1)
         self._wave_file.setsampwidth(2)  # 16 bits
         self._wave_file.setframerate(sample_rate)
+        self._wave_flush_bytes = sample_rate * 2
         self._detector = CryDetector(sample_rate)
 
     def process_frame(self, frame) -> Optional[CryEvent]:
 
-        array = frame.to_ndarray()
-        if array.ndim > 1:
-            array = array.mean(axis=0)
-        pcm = np.round(array).astype(np.int16)
-
+        pcm = self._mono_pcm(frame)
         if pcm.size == 0:
             return None
 
@@ -126,20 +234,68 @@ class AudioAnalyzer:
             self._detector = CryDetector(sample_rate)
 
         self.ensure_writer(sample_rate)
+        self._record_pcm(pcm)
 
-        if self.record_audio and self._wave_file is not None:
-            self._wave_file.writeframes(pcm.tobytes())
-
-        float_samples = pcm.astype(np.float32) / 32768.0
+        if self._float_scratch.size < pcm.size:
+            self._float_scratch = np.empty(pcm.size, dtype=np.float32)
+        float_samples = self._float_scratch[: pcm.size]
+        np.multiply(pcm, np.float32(1.0 / 32768.0), out=float_samples)
         event = self._detector.process_samples(float_samples)
         if event and (event.timestamp - self._last_cry_ts) >= self._cry_cooldown:
             self._last_cry_ts = event.timestamp
             return event
         return None
 
+    def record_frame(self, frame) -> None:
+        """Record ``frame`` without running cry detection on it."""
+        if not self.record_audio:
+            return
+        pcm = self._mono_pcm(frame)
+        if pcm.size == 0:
+            return
+        self.ensure_writer(frame.sample_rate)
+        self._record_pcm(pcm)
+
+    def _record_pcm(self, pcm: np.ndarray) -> None:
+        if self.record_audio and self._wave_file is not None:
+            self._wave_buffer += memoryview(pcm).cast("B")
+            if len(self._wave_buffer) >= self._wave_flush_bytes:
+                self._flush_wave()
+
+    def _mono_pcm(self, frame) -> np.ndarray:
+        """Mono int16 samples of ``frame``, averaging channels when needed."""
+        array = frame.to_ndarray()
+        channels = len(frame.layout.channels)
+        # Planar frames hold one row per channel; packed frames interleave
+        # the channels in a single row.
+        rows = array if frame.format.is_planar else array.reshape(-1, channels).T
+        if array.dtype != np.int16 or channels > 2:
+            return np.round(rows.mean(axis=0)).astype(np.int16)
+        if channels == 1:
+            return rows[0]
+        size = rows.shape[1]
+        if self._pcm_scratch.size < size:
+            self._mix_scratch = np.empty(size, dtype=np.int32)
+            self._pcm_scratch = np.empty(size, dtype=np.int16)
+        mixed = self._mix_scratch[:size]
+        np.add(rows[0], rows[1], out=mixed, dtype=np.int32)
+        # A bare ">> 1" floors (-1 and 0 mix to -1); adding 1 first rounds
+        # halves up instead, so quiet signals are not biased negative.
+        np.add(mixed, 1, out=mixed)
+        np.right_shift(mixed, 1, out=mixed)
+        pcm = self._pcm_scratch[:size]
+        pcm[:] = mixed
+        return pcm
+
+    def _flush_wave(self) -> None:
+        if self._wave_file is not None and self._wave_buffer:
+            self._wave_file.writeframes(self._wave_buffer)
+        self._wave_buffer.clear()
+
     def close(self) -> None:
         if self._wave_file:
             try:
+                self._flush_wave()
                 self._wave_file.close()
             except OSError:
                 pass
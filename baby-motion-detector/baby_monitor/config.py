@@ -1,10 +1,14 @@
 from __future__ import annotations
 
-import argparse
+import functools
 import os
+import sys
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Iterable, List
+from typing import TYPE_CHECKING, Iterable, List
+
+if TYPE_CHECKING:
+    import argparse
 
 
 def _parse_bool(value: str | None, default: bool) -> bool:
@@ -17,6 +21,92 @@ _DEFAULT_AUDIO_DIR = _ANALYZER_ROOT / "output" / "audio"
 _DEFAULT_SNAPSHOT_DIR = _ANALYZER_ROOT / "output" / "snapshots"
 
 
+@functools.lru_cache(maxsize=1)
+def _build_parser() -> argparse.ArgumentParser:
+    # argparse (and gettext, textwrap) is only needed on the CLI path.
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description="BabyPhone WebRTC stream analyzer"
+    )
+    parser.add_argument(
+        "--signaling",
+        help="Signaling WebSocket URL (wss://...)",
+    )
+    parser.add_argument(
+        "--room",
+        help="Room to join (default: baby)",
+    )
+    parser.add_argument(
+        "--stun",
+        nargs="*",
+        help="Space-separated list of STUN servers",
+    )
+    group = parser.add_mutually_exclusive_group()
+    group.add_argument(
+        "--ssl-verify",
+        dest="disable_ssl_verify",
+        action="store_false",
+        help="Enable strict TLS verification",
+    )
+    group.add_argument(
+        "--no-ssl-verify",
+        dest="disable_ssl_verify",
+        action="store_true",
+        help="Disable TLS verification (for self-signed certs)",
+    )
+    parser.add_argument(
+        "--audio-dir",
+        help="Directory for recorded audio",
+    )
+    audio_group = parser.add_mutually_exclusive_group()
+    audio_group.add_argument(
+        "--record-audio",
+        dest="record_audio",
+        action="store_true",
+        help="Persist the audio stream to disk (WAV)",
+    )
+    audio_group.add_argument(
+        "--no-record-audio",
+        dest="record_audio",
+        action="store_false",
+        help="Do not record audio to disk (default)",
+    )
+    parser.add_argument(
+        "--log-level",
+        help="Logging level (DEBUG, INFO, WARNING, ...)",
+    )
+    parser.add_argument(
+        "--snapshot-dir",
+        help="Directory where annotated snapshots are stored",
+    )
+    snapshot_group = parser.add_mutually_exclusive_group()
+    snapshot_group.add_argument(
+        "--snapshots",
+        dest="snapshot_on_event",
+        action="store_true",
+        help="Enable annotated snapshots for each event",
+    )
+    snapshot_group.add_argument(
+        "--no-snapshots",
+        dest="snapshot_on_event",
+        action="store_false",
+        help="Disable annotated snapshots",
+    )
+    parser.add_argument(
+        "--pose-fps",
+        type=float,
+        help="Maximum pose analysis rate in frames per second (0 = every frame)",
+    )
+    parser.add_argument(
+        "--pose-cpus",
+        nargs="*",
+        type=int,
+        help="CPU cores to pin the pose worker process to (Linux only)",
+    )
+    return parser
+
+
 @dataclass
 class AnalyzerConfig:
     """Runtime configuration for the analyzer client."""
@@ -32,6 +122,8 @@ class AnalyzerConfig:
     log_level: str = "INFO"
     snapshot_on_event: bool = False
     snapshot_dir: str = str(_DEFAULT_SNAPSHOT_DIR)
+    pose_fps: float = 8.0
+    pose_cpus: List[int] = field(default_factory=list)
 
     @classmethod
     def from_env(cls) -> "AnalyzerConfig":
@@ -41,9 +133,9 @@ class AnalyzerConfig:
         stun_raw = os.getenv("ANALYZER_STUN", "")
         if stun_raw:
             cfg.stun_servers = [s.strip() for s in stun_raw.split(",") if s.strip()]
-        cfg.disable_ssl_verify = not _parse_bool(
-            os.getenv("ANALYZER_SSL_VERIFY"), default=not cfg.disable_ssl_verify
-        )
+        ssl_verify_raw = os.getenv("ANALYZER_SSL_VERIFY")
+        if ssl_verify_raw is not None:
+            cfg.disable_ssl_verify = not _parse_bool(ssl_verify_raw, default=True)
         cfg.audio_output_dir = os.getenv(
             "ANALYZER_AUDIO_DIR", cfg.audio_output_dir
         )
@@ -55,88 +147,42 @@ class AnalyzerConfig:
             os.getenv("ANALYZER_SNAPSHOT_ON_EVENT"), default=cfg.snapshot_on_event
         )
         cfg.snapshot_dir = os.getenv("ANALYZER_SNAPSHOT_DIR", cfg.snapshot_dir)
+        pose_fps_raw = os.getenv("ANALYZER_POSE_FPS")
+        if pose_fps_raw:
+            cfg.pose_fps = float(pose_fps_raw)
+        pose_cpus_raw = os.getenv("ANALYZER_POSE_CPUS", "")
+        if pose_cpus_raw:
+            cfg.pose_cpus = [int(c) for c in pose_cpus_raw.split(",") if c.strip()]
         return cfg
 
     @classmethod
     def from_args(cls, argv: Iterable[str] | None = None) -> "AnalyzerConfig":
+        if argv is None:
+            argv = sys.argv[1:]
+        argv = list(argv)
+        if not argv:
+            # Nothing to parse: the environment alone defines the config.
+            return cls.from_env()
+
+        import argparse
+
         env_cfg = cls.from_env()
-        parser = argparse.ArgumentParser(
-            description="BabyPhone WebRTC stream analyzer"
-        )
-        parser.add_argument(
-            "--signaling",
-            default=env_cfg.signaling_url,
-            help="Signaling WebSocket URL (wss://...)",
-        )
-        parser.add_argument(
-            "--room",
-            default=env_cfg.room,
-            help="Room to join (default: baby)",
-        )
-        parser.add_argument(
-            "--stun",
-            nargs="*",
-            default=env_cfg.stun_servers,
-            help="Space-separated list of STUN servers",
-        )
-        group = parser.add_mutually_exclusive_group()
-        group.add_argument(
-            "--ssl-verify",
-            dest="disable_ssl_verify",
-            action="store_false",
-            help="Enable strict TLS verification",
-        )
-        group.add_argument(
-            "--no-ssl-verify",
-            dest="disable_ssl_verify",
-            action="store_true",
-            help="Disable TLS verification (for self-signed certs)",
-        )
-        parser.set_defaults(disable_ssl_verify=env_cfg.disable_ssl_verify)
-        parser.add_argument(
-            "--audio-dir",
-            default=env_cfg.audio_output_dir,
-            help="Directory for recorded audio",
-        )
-        audio_group = parser.add_mutually_exclusive_group()
-        audio_group.add_argument(
-            "--record-audio",
-            dest="record_audio",
-            action="store_true",
-            help="Persist the audio stream to disk (WAV)",
-        )
-        audio_group.add_argument(
-            "--no-record-audio",
-            dest="record_audio",
-            action="store_false",
-            help="Do not record audio to disk (default)",
-        )
-        parser.set_defaults(record_audio=env_cfg.record_audio)
-        parser.add_argument(
-            "--log-level",
-            default=env_cfg.log_level,
-            help="Logging level (DEBUG, INFO, WARNING, ...)",
-        )
-        parser.add_argument(
-            "--snapshot-dir",
-            default=env_cfg.snapshot_dir,
-            help="Directory where annotated snapshots are stored",
-        )
-        snapshot_group = parser.add_mutually_exclusive_group()
-        snapshot_group.add_argument(
-            "--snapshots",
-            dest="snapshot_on_event",
-            action="store_true",
-            help="Enable annotated snapshots for each event",
-        )
-        snapshot_group.add_argument(
-            "--no-snapshots",
-            dest="snapshot_on_event",
-            action="store_false",
-            help="Disable annotated snapshots",
-        )
-        parser.set_defaults(snapshot_on_event=env_cfg.snapshot_on_event)
-        args = parser.parse_args(argv)
+        # Values already on the namespace take precedence over the parser's
+        # (absent) defaults, so the cached parser stays environment-agnostic.
+        defaults = argparse.Namespace(
+            signaling=env_cfg.signaling_url,
+            room=env_cfg.room,
+            stun=env_cfg.stun_servers,
+            disable_ssl_verify=env_cfg.disable_ssl_verify,
+            audio_dir=env_cfg.audio_output_dir,
+            record_audio=env_cfg.record_audio,
+            log_level=env_cfg.log_level,
+            snapshot_dir=env_cfg.snapshot_dir,
+            snapshot_on_event=env_cfg.snapshot_on_event,
+            pose_fps=env_cfg.pose_fps,
+            pose_cpus=env_cfg.pose_cpus,
+        )
+        args = _build_parser().parse_args(argv, namespace=defaults)
         return cls(
             signaling_url=args.signaling,
             room=args.room,
@@ -147,4 +193,6 @@ class AnalyzerConfig:
             log_level=args.log_level.upper(),
             snapshot_on_event=args.snapshot_on_event,
             snapshot_dir=args.snapshot_dir,
+            pose_fps=args.pose_fps,
+            pose_cpus=list(args.pose_cpus),
         )
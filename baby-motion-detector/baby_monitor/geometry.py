@@ -0,0 +1,239 @@
+"""Per-frame pose geometry kernels.
+
+The kernels are compiled with Numba when it is installed and run as plain
+Python otherwise. They only use scalar math so both paths give the same
+results. Missing measurements are reported as NaN, which every threshold
+comparison in ``classify_posture`` treats as "no vote".
+"""
+
+from __future__ import annotations
+
+import math
+from typing import Tuple
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # pragma: no cover - numba is optional
+
+    def njit(*args, **kwargs):
+        if args and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+
+NUM_LANDMARKS = 33
+
+# Landmark indices in MediaPipe pose model (33 landmarks).
+LEFT_SHOULDER = 11
+RIGHT_SHOULDER = 12
+LEFT_HIP = 23
+RIGHT_HIP = 24
+LEFT_KNEE = 25
+RIGHT_KNEE = 26
+LEFT_ANKLE = 27
+RIGHT_ANKLE = 28
+
+# Column layout of the landmark buffer filled by PoseAnalyzer.
+WORLD_X, WORLD_Y, WORLD_Z, IMAGE_X, IMAGE_Y, VISIBILITY = range(6)
+
+# Posture codes returned by classify_posture, indexing POSTURES.
+LYING, SITTING, STANDING = 0, 1, 2
+POSTURES = ("lying", "sitting", "standing")
+
+
+@njit(cache=True)
+def _joint_angle(landmarks: np.ndarray, a: int, b: int, c: int) -> float:
+    bax = landmarks[a, WORLD_X] - landmarks[b, WORLD_X]
+    bay = landmarks[a, WORLD_Y] - landmarks[b, WORLD_Y]
+    baz = landmarks[a, WORLD_Z] - landmarks[b, WORLD_Z]
+    bcx = landmarks[c, WORLD_X] - landmarks[b, WORLD_X]
+    bcy = landmarks[c, WORLD_Y] - landmarks[b, WORLD_Y]
+    bcz = landmarks[c, WORLD_Z] - landmarks[b, WORLD_Z]
+    if bax * bax + bay * bay + baz * baz < 1e-12 or bcx * bcx + bcy * bcy + bcz * bcz < 1e-12:
+        return 0.0
+    # atan2(|ba x bc|, ba . bc) is well conditioned at 0 and 180 degrees and
+    # needs neither normalization nor clamping, unlike acos.
+    cx = bay * bcz - baz * bcy
+    cy = baz * bcx - bax * bcz
+    cz = bax * bcy - bay * bcx
+    cross_norm = math.sqrt(cx * cx + cy * cy + cz * cz)
+    return math.degrees(math.atan2(cross_norm, bax * bcx + bay * bcy + baz * bcz))
+
+
+@njit(cache=True)
+def _knee_angle(
+    landmarks: np.ndarray, hip: int, knee: int, ankle: int, threshold: float
+) -> float:
+    if (
+        landmarks[hip, VISIBILITY] >= threshold
+        and landmarks[knee, VISIBILITY] >= threshold
+        and landmarks[ankle, VISIBILITY] >= threshold
+    ):
+        return _joint_angle(landmarks, hip, knee, ankle)
+    return math.nan
+
+
+@njit(cache=True)
+def _mean_height(landmarks: np.ndarray, left: int, right: int, threshold: float) -> float:
+    total = 0.0
+    count = 0
+    if landmarks[left, VISIBILITY] >= threshold:
+        total += landmarks[left, IMAGE_Y]
+        count += 1
+    if landmarks[right, VISIBILITY] >= threshold:
+        total += landmarks[right, IMAGE_Y]
+        count += 1
+    if count == 0:
+        return math.nan
+    return total / count
+
+
+@njit(cache=True)
+def compute_pose_features(
+    landmarks: np.ndarray, visibility_threshold: float
+) -> Tuple[float, float, float, float, float, float, float, float, float, float, float]:
+    """
+    Compute torso, knee and leg geometry from the (33, 6) landmark buffer.
+
+    Returns ``(torso_norm, torso_angle, forward_component, left_knee_angle,
+    right_knee_angle, avg_knee_angle, hip_height, knee_height, ankle_height,
+    leg_span, knee_span)``. Angles are in degrees and the torso angle is
+    measured against the vertical axis. Values that cannot be measured are
+    NaN. Callers must discard the frame when ``torso_norm`` is close to zero.
+    """
+    tx = 0.5 * (landmarks[LEFT_SHOULDER, WORLD_X] + landmarks[RIGHT_SHOULDER, WORLD_X]) - 0.5 * (
+        landmarks[LEFT_HIP, WORLD_X] + landmarks[RIGHT_HIP, WORLD_X]
+    )
+    ty = 0.5 * (landmarks[LEFT_SHOULDER, WORLD_Y] + landmarks[RIGHT_SHOULDER, WORLD_Y]) - 0.5 * (
+        landmarks[LEFT_HIP, WORLD_Y] + landmarks[RIGHT_HIP, WORLD_Y]
+    )
+    tz = 0.5 * (landmarks[LEFT_SHOULDER, WORLD_Z] + landmarks[RIGHT_SHOULDER, WORLD_Z]) - 0.5 * (
+        landmarks[LEFT_HIP, WORLD_Z] + landmarks[RIGHT_HIP, WORLD_Z]
+    )
+    torso_norm = math.sqrt(tx * tx + ty * ty + tz * tz)
+    if torso_norm < 1e-6:
+        nan = math.nan
+        return torso_norm, 90.0, 0.0, nan, nan, nan, nan, nan, nan, nan, nan
+
+    # Vertical axis is (0, -1, 0) in MediaPipe world coordinates.
+    torso_angle = math.degrees(math.atan2(math.hypot(tx, tz), -ty))
+    forward_component = abs(tz) / torso_norm
+
+    left_knee = _knee_angle(landmarks, LEFT_HIP, LEFT_KNEE, LEFT_ANKLE, visibility_threshold)
+    right_knee = _knee_angle(landmarks, RIGHT_HIP, RIGHT_KNEE, RIGHT_ANKLE, visibility_threshold)
+    if math.isnan(left_knee):
+        avg_knee = right_knee
+    elif math.isnan(right_knee):
+        avg_knee = left_knee
+    else:
+        avg_knee = 0.5 * (left_knee + right_knee)
+
+    hip_height = _mean_height(landmarks, LEFT_HIP, RIGHT_HIP, visibility_threshold)
+    knee_height = _mean_height(landmarks, LEFT_KNEE, RIGHT_KNEE, visibility_threshold)
+    ankle_height = _mean_height(landmarks, LEFT_ANKLE, RIGHT_ANKLE, visibility_threshold)
+
+    return (
+        torso_norm,
+        torso_angle,
+        forward_component,
+        left_knee,
+        right_knee,
+        avg_knee,
+        hip_height,
+        knee_height,
+        ankle_height,
+        ankle_height - hip_height,
+        knee_height - hip_height,
+    )
+
+
+@njit(cache=True)
+def classify_posture(
+    angle_deg: float,
+    forward_component: float,
+    avg_knee_angle: float,
+    leg_extension: float,
+    leg_span: float,
+    knee_span: float,
+    standing_angle: float,
+    lying_angle: float,
+    lying_forward_ratio: float,
+    standing_forward_ratio: float,
+    standing_knee_angle: float,
+    sitting_knee_min: float,
+    sitting_knee_max: float,
+    standing_leg_extension_min: float,
+    sitting_leg_extension_max: float,
+) -> int:
+    """Classify the posture as LYING, SITTING or STANDING (NaN inputs abstain)."""
+    if angle_deg >= lying_angle + 5.0 or forward_component >= lying_forward_ratio + 0.08:
+        return LYING
+
+    # Each rule adds one vote; comparisons against NaN are False so missing
+    # measurements abstain without extra branches.
+    standing_score = (
+        int(avg_knee_angle >= standing_knee_angle)
+        + int(leg_extension >= standing_leg_extension_min)
+        + int(leg_span >= 0.22)
+        + int(knee_span >= 0.12)
+    )
+    sitting_score = (
+        int(sitting_knee_min <= avg_knee_angle <= sitting_knee_max)
+        + int(leg_extension <= sitting_leg_extension_max)
+        + int(leg_span < 0.18)
+        + int(knee_span < 0.10)
+    )
+
+    upright = angle_deg <= standing_angle + 5.0 and forward_component <= standing_forward_ratio + 0.05
+    standing_score += int(upright)
+    sitting_score += int(not upright and angle_deg <= lying_angle + 8.0)
+
+    if standing_score >= max(sitting_score, 2):
+        return STANDING
+    if sitting_score >= max(standing_score, 2):
+        return SITTING
+    # fallback heuristics
+    if angle_deg <= lying_angle + 8.0:
+        return SITTING
+    if angle_deg <= standing_angle + 6.0:
+        return STANDING
+    return LYING
+
+
+@njit(cache=True)
+def movement_score(
+    landmarks: np.ndarray, previous: np.ndarray, visibility_threshold: float
+) -> float:
+    """
+    Mean world-space displacement between two landmark buffers.
+
+    Only landmarks visible in both frames count; returns 0.0 when there are
+    none.
+    """
+    total = 0.0
+    count = 0
+    for i in range(landmarks.shape[0]):
+        if (
+            landmarks[i, VISIBILITY] >= visibility_threshold
+            and previous[i, VISIBILITY] >= visibility_threshold
+        ):
+            dx = landmarks[i, WORLD_X] - previous[i, WORLD_X]
+            dy = landmarks[i, WORLD_Y] - previous[i, WORLD_Y]
+            dz = landmarks[i, WORLD_Z] - previous[i, WORLD_Z]
+            total += math.sqrt(dx * dx + dy * dy + dz * dz)
+            count += 1
+    if count == 0:
+        return 0.0
+    return total / count
+
+
+def warm_up() -> None:
+    """Compile the kernels ahead of the first frame (no-op without Numba)."""
+    landmarks = np.zeros((NUM_LANDMARKS, 6), dtype=np.float32)
+    landmarks[LEFT_SHOULDER, WORLD_Y] = landmarks[RIGHT_SHOULDER, WORLD_Y] = -0.5
+    compute_pose_features(landmarks, 0.5)
+    movement_score(landmarks, landmarks, 0.5)
+    nan = math.nan
+    classify_posture(0.0, 0.0, nan, nan, nan, nan, *([0.0] * 9))
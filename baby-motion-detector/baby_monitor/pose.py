@@ -1,39 +1,39 @@
 from __future__ import annotations
 
+import functools
+import logging
 import math
 import os
+import shutil
+import sys
 import time
+import types
+import urllib.error
 import urllib.request
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, Optional, Tuple
+from typing import TYPE_CHECKING, Dict, Optional, Tuple
 
 import cv2
-import mediapipe as mp
 import numpy as np
-from mediapipe.tasks import python as mp_python
-from mediapipe.tasks.python.vision import (
-    PoseLandmarker,
-    PoseLandmarkerOptions,
-    PoseLandmarkerResult,
-    RunningMode,
-)
+
+if TYPE_CHECKING:
+    from mediapipe.tasks.python.vision import (
+        PoseLandmarker,
+        PoseLandmarkerOptions,
+        PoseLandmarkerResult,
+    )
+
+from . import geometry
+from .geometry import IMAGE_X, NUM_LANDMARKS, POSTURES, classify_posture, compute_pose_features
 
 MODEL_URL = (
     "https://storage.googleapis.com/mediapipe-models/pose_landmarker/"
-    "pose_landmarker_full/float16/latest/pose_landmarker_full.task"
+    "pose_landmarker_{variant}/float16/latest/pose_landmarker_{variant}.task"
 )
-MODEL_NAME = "pose_landmarker_full.task"
-
-# Landmark indices in MediaPipe pose model (33 landmarks).
-LEFT_SHOULDER = 11
-RIGHT_SHOULDER = 12
-LEFT_HIP = 23
-RIGHT_HIP = 24
-LEFT_KNEE = 25
-RIGHT_KNEE = 26
-LEFT_ANKLE = 27
-RIGHT_ANKLE = 28
+MODEL_NAME = "pose_landmarker_{variant}.task"
+MODEL_VARIANTS = ("lite", "full", "heavy")
+MODELS_DIR = Path(__file__).resolve().parents[1] / "models"
 
 # Connections for drawing (subset sufficient for skeleton overlay).
 POSE_CONNECTIONS = [
@@ -41,16 +41,123 @@ POSE_CONNECTIONS = [
     (11, 13), (13, 15), (12, 14), (14, 16),  # arms
     (23, 25), (25, 27), (24, 26), (26, 28),  # legs
 ]
-
-
-@dataclass
+_CONNECTION_INDEX = np.array(POSE_CONNECTIONS, dtype=np.intp)
+
+
+@functools.cache
+def _mediapipe() -> types.SimpleNamespace:
+    """Import MediaPipe on first use.
+
+    Only the pose worker process runs inference; the event loop process
+    imports this module for the observation types and never pays for it.
+    """
+    import mediapipe as mp
+    from mediapipe.tasks import python as mp_python
+    from mediapipe.tasks.python.vision import (
+        PoseLandmarker,
+        PoseLandmarkerOptions,
+        RunningMode,
+    )
+
+    return types.SimpleNamespace(
+        Image=mp.Image,
+        ImageFormat=mp.ImageFormat,
+        BaseOptions=mp_python.BaseOptions,
+        PoseLandmarker=PoseLandmarker,
+        PoseLandmarkerOptions=PoseLandmarkerOptions,
+        RunningMode=RunningMode,
+    )
+
+
+def _gpu_device_present() -> bool:
+    """Cheap pre-check so CPU-only hosts never fetch the GPU model.
+
+    On Linux the GPU delegate renders through EGL, which needs a DRM render
+    node; elsewhere creating the delegate is the only test.
+    """
+    if sys.platform.startswith("linux"):
+        return any(Path("/dev/dri").glob("renderD*"))
+    return True
+
+
+@functools.lru_cache(maxsize=None)
+def _resolve_model_path(variant: str) -> Path:
+    """Local path of the bundled model, downloaded once per process."""
+    MODELS_DIR.mkdir(parents=True, exist_ok=True)
+    model_path = MODELS_DIR / MODEL_NAME.format(variant=variant)
+    if not model_path.exists():
+        try:
+            _download_model(MODEL_URL.format(variant=variant), model_path)
+        except Exception as exc:
+            raise RuntimeError(
+                "Unable to download pose landmarker model. "
+                "Set POSE_MODEL_PATH to a local .task file."
+            ) from exc
+    return model_path
+
+
+def _download_model(url: str, model_path: Path) -> None:
+    """Download ``url`` to ``model_path``, resuming an interrupted download.
+
+    Data goes to a ``.part`` file that is renamed once complete, so a failed
+    download never leaves a truncated model behind.
+    """
+    partial = model_path.with_name(model_path.name + ".part")
+    offset = partial.stat().st_size if partial.exists() else 0
+    headers = {"Range": f"bytes={offset}-"} if offset else {}
+    request = urllib.request.Request(url, headers=headers)
+    try:
+        response = urllib.request.urlopen(request, timeout=30)
+    except urllib.error.HTTPError as exc:
+        if exc.code != 416 or not offset:
+            raise
+        # Stale partial file the server cannot resume from: start over.
+        partial.unlink()
+        _download_model(url, model_path)
+        return
+    with response:
+        # A server ignoring the Range header sends the whole file again.
+        mode = "ab" if offset and response.status == 206 else "wb"
+        with partial.open(mode) as out:
+            shutil.copyfileobj(response, out, 1 << 20)
+    partial.replace(model_path)
+
+
+@dataclass(slots=True)
+class PoseExtras:
+    """Geometry measured on a frame; NaN when not computable."""
+
+    torso_angle: float = math.nan
+    forward_component: float = math.nan
+    avg_knee_angle: float = math.nan
+    left_knee_angle: float = math.nan
+    right_knee_angle: float = math.nan
+    leg_extension: float = math.nan
+    leg_span: float = math.nan
+    knee_span: float = math.nan
+    hip_height: float = math.nan
+    knee_height: float = math.nan
+    ankle_height: float = math.nan
+
+    def as_dict(self) -> Dict[str, float]:
+        """Measured values only, for event payloads."""
+        values = {}
+        for name in self.__slots__:
+            value = getattr(self, name)
+            if not math.isnan(value):
+                values[name] = float(value)
+        return values
+
+
+@dataclass(slots=True)
 class PoseObservation:
-    timestamp: float
     posture: str
+    # Mean landmark speed (world meters per second) since the previous frame.
     movement_score: float
     movement_detected: bool
-    pose_landmarks: Optional[list] = None
-    extras: Dict[str, float] = field(default_factory=dict)
+    # Image-space x, y (normalized) and visibility, one row per landmark.
+    pose_landmarks: Optional[np.ndarray] = None
+    extras: PoseExtras = field(default_factory=PoseExtras)
 
 
 class PoseAnalyzer:
@@ -58,7 +165,7 @@ class PoseAnalyzer:
 
     def __init__(
         self,
-        movement_threshold: float = 0.08,
+        movement_threshold: float = 1.2,
         smoothing: float = 0.6,
         visibility_threshold: float = 0.5,
         standing_angle: float = 35.0,
@@ -71,311 +178,236 @@ class PoseAnalyzer:
         standing_leg_extension_min: float = 0.22,
         sitting_leg_extension_max: float = 0.18,
     ) -> None:
-        model_path = self._ensure_model()
-        base_options = mp_python.BaseOptions(model_asset_path=str(model_path))
-        options = PoseLandmarkerOptions(
-            base_options=base_options,
-            running_mode=RunningMode.IMAGE,
-            min_pose_detection_confidence=0.5,
-            min_pose_presence_confidence=0.5,
-            min_tracking_confidence=0.5,
-        )
-        self._landmarker = PoseLandmarker.create_from_options(options)
+        self._mp = _mediapipe()
+        self._landmarker = self._create_landmarker()
         self._movement_threshold = movement_threshold
         self._angle_smoothing = smoothing
+        self._angle_blend = 1.0 - smoothing
         self._previous_angle: Optional[float] = None
-        self._prev_world_landmarks: Optional[np.ndarray] = None
+        self._last_timestamp_ms = -1
+        # Previous frame's landmark buffer and timestamp, for the movement score.
+        self._prev_landmarks = np.empty((NUM_LANDMARKS, 6), dtype=np.float32)
+        self._prev_landmarks_ms = 0
+        self._has_prev_landmarks = False
+        # Per-frame landmark storage, reused across frames: world x, y, z then
+        # image-space x, y and visibility of each landmark.
+        self._landmark_buffer = np.empty((NUM_LANDMARKS, 6), dtype=np.float32)
+        self._landmark_values = self._landmark_buffer.reshape(-1)
+        # RGB copy of the incoming frame, reallocated only when the size changes.
+        self._rgb_buffer: Optional[np.ndarray] = None
         self._visibility_threshold = visibility_threshold
-        self._standing_angle = standing_angle
-        self._lying_angle = lying_angle
-        self._lying_forward_ratio = lying_forward_ratio
-        self._standing_forward_ratio = standing_forward_ratio
-        self._standing_knee_angle = standing_knee_angle
-        self._sitting_knee_min = sitting_knee_min
-        self._sitting_knee_max = sitting_knee_max
-        self._standing_leg_extension_min = standing_leg_extension_min
-        self._sitting_leg_extension_max = sitting_leg_extension_max
+        # Passed positionally to geometry.classify_posture after the features.
+        self._posture_thresholds = (
+            standing_angle,
+            lying_angle,
+            lying_forward_ratio,
+            standing_forward_ratio,
+            standing_knee_angle,
+            sitting_knee_min,
+            sitting_knee_max,
+            standing_leg_extension_min,
+            sitting_leg_extension_max,
+        )
+        geometry.warm_up()
 
     def close(self) -> None:
         self._landmarker.close()
 
     def process_frame(self, frame_bgr: np.ndarray) -> Optional[PoseObservation]:
-        frame_rgb = cv2.cvtColor(frame_bgr, cv2.COLOR_BGR2RGB)
-        mp_image = mp.Image(image_format=mp.ImageFormat.SRGB, data=frame_rgb)
-        result: PoseLandmarkerResult = self._landmarker.detect(mp_image)
+        rgb = self._rgb_target(frame_bgr.shape[0], frame_bgr.shape[1])
+        cv2.cvtColor(frame_bgr, cv2.COLOR_BGR2RGB, dst=rgb)
+        return self._process_rgb(rgb)
+
+    def process_i420_frame(self, planes: np.ndarray) -> Optional[PoseObservation]:
+        """Analyze a planar I420 frame, converting it straight to RGB."""
+        rgb = self._rgb_target(planes.shape[0] * 2 // 3, planes.shape[1])
+        cv2.cvtColor(planes, cv2.COLOR_YUV2RGB_I420, dst=rgb)
+        return self._process_rgb(rgb)
+
+    def _rgb_target(self, height: int, width: int) -> np.ndarray:
+        if self._rgb_buffer is None or self._rgb_buffer.shape[:2] != (height, width):
+            self._rgb_buffer = np.empty((height, width, 3), dtype=np.uint8)
+        return self._rgb_buffer
+
+    def _process_rgb(self, frame_rgb: np.ndarray) -> Optional[PoseObservation]:
+        # mp.Image copies the pixels into its own ImageFrame, so it cannot be
+        # reused across frames; the RGB buffer it is built from is.
+        mp_image = self._mp.Image(image_format=self._mp.ImageFormat.SRGB, data=frame_rgb)
+        # VIDEO mode requires strictly increasing timestamps.
+        timestamp_ms = max(int(time.monotonic() * 1000), self._last_timestamp_ms + 1)
+        self._last_timestamp_ms = timestamp_ms
+        result: PoseLandmarkerResult = self._landmarker.detect_for_video(mp_image, timestamp_ms)
         if not result.pose_landmarks or not result.pose_world_landmarks:
             self._invalidate_state()
             return None
 
-        pose_landmarks = result.pose_landmarks[0]
-        world_landmarks = np.array(
-            [[lm.x, lm.y, lm.z] for lm in result.pose_world_landmarks[0]],
-            dtype=np.float32,
-        )
-        visibility = np.array([lm.visibility for lm in pose_landmarks], dtype=np.float32)
-        visibility_mask = visibility >= self._visibility_threshold
-
-        torso_vector = self._torso_vector(world_landmarks)
-        torso_norm = np.linalg.norm(torso_vector)
+        buffer = self._landmark_buffer
+        # A flat list of floats converts faster than nested tuples.
+        self._landmark_values[:] = [
+            value
+            for world, image in zip(result.pose_world_landmarks[0], result.pose_landmarks[0])
+            for value in (world.x, world.y, world.z, image.x, image.y, image.visibility)
+        ]
+
+        (
+            torso_norm,
+            angle_deg,
+            forward_component,
+            left_knee_angle,
+            right_knee_angle,
+            avg_knee_angle,
+            hip_height,
+            knee_height,
+            ankle_height,
+            leg_span,
+            knee_span,
+        ) = compute_pose_features(buffer, self._visibility_threshold)
         if torso_norm < 1e-6:
             self._invalidate_state()
             return None
 
-        angle_deg = self._angle_with_vertical(torso_vector)
         smoothed_angle = self._smooth_angle(angle_deg)
-        forward_component = abs(torso_vector[2]) / torso_norm
-        avg_knee_angle, left_knee_angle, right_knee_angle = self._compute_knee_angles(
-            world_landmarks, visibility_mask
-        )
-        leg_extension = self._leg_extension(pose_landmarks)
-        hip_height = self._mean_y(pose_landmarks, [LEFT_HIP, RIGHT_HIP])
-        knee_height = self._mean_y(pose_landmarks, [LEFT_KNEE, RIGHT_KNEE])
-        ankle_height = self._mean_y(pose_landmarks, [LEFT_ANKLE, RIGHT_ANKLE])
-        leg_span = None
-        knee_span = None
-        if hip_height is not None and ankle_height is not None:
-            leg_span = float(ankle_height - hip_height)
-        if hip_height is not None and knee_height is not None:
-            knee_span = float(knee_height - hip_height)
-
-        posture = self._classify_posture(
-            smoothed_angle,
-            forward_component,
-            avg_knee_angle,
-            leg_extension,
-            leg_span,
-            knee_span,
+        # Ankle-to-hip extension in image space (same quantity as leg_span).
+        leg_extension = leg_span
+        posture = POSTURES[
+            classify_posture(
+                smoothed_angle,
+                forward_component,
+                avg_knee_angle,
+                leg_extension,
+                leg_span,
+                knee_span,
+                *self._posture_thresholds,
+            )
+        ]
+
+        movement_score, movement_detected = self._movement_metric(buffer, timestamp_ms)
+        extras = PoseExtras(
+            torso_angle=smoothed_angle,
+            forward_component=forward_component,
+            avg_knee_angle=avg_knee_angle,
+            left_knee_angle=left_knee_angle,
+            right_knee_angle=right_knee_angle,
+            leg_extension=leg_extension,
+            leg_span=leg_span,
+            knee_span=knee_span,
+            hip_height=hip_height,
+            knee_height=knee_height,
+            ankle_height=ankle_height,
         )
 
-        movement_score, movement_detected = self._movement_metric(world_landmarks, visibility_mask)
-        extras = {
-            "torso_angle": float(smoothed_angle),
-            "forward_component": forward_component,
-            "movement_score": movement_score,
-            "posture": posture,
-            "avg_knee_angle": float(avg_knee_angle) if avg_knee_angle is not None else None,
-            "left_knee_angle": float(left_knee_angle) if left_knee_angle is not None else None,
-            "right_knee_angle": float(right_knee_angle) if right_knee_angle is not None else None,
-            "leg_extension": leg_extension,
-            "leg_span": leg_span,
-            "knee_span": knee_span,
-            "hip_height": hip_height,
-            "knee_height": knee_height,
-            "ankle_height": ankle_height,
-        }
-
-        extras_clean = {k: v for k, v in extras.items() if v is not None}
-
         return PoseObservation(
-            timestamp=time.time(),
             posture=posture,
             movement_score=movement_score,
             movement_detected=movement_detected,
-            pose_landmarks=pose_landmarks,
-            extras=extras_clean,
+            pose_landmarks=buffer[:, IMAGE_X:].copy(),
+            extras=extras,
         )
 
-    def annotate_frame(self, frame_bgr: np.ndarray, pose_landmarks) -> np.ndarray:
-        if not pose_landmarks:
+    def annotate_frame(
+        self,
+        frame_bgr: np.ndarray,
+        pose_landmarks: Optional[np.ndarray],
+        *,
+        out: Optional[np.ndarray] = None,
+        inplace: bool = False,
+    ) -> np.ndarray:
+        """Draw the skeleton on a copy of the frame.
+
+        With ``inplace`` the frame itself is drawn on; otherwise ``out``, if
+        given, is reused as the destination instead of allocating a copy.
+        """
+        if pose_landmarks is None:
             return frame_bgr
-        annotated = frame_bgr.copy()
+        if inplace:
+            annotated = frame_bgr
+        elif out is not None:
+            np.copyto(out, frame_bgr)
+            annotated = out
+        else:
+            annotated = frame_bgr.copy()
         height, width = frame_bgr.shape[:2]
-        points = []
-        for lm in pose_landmarks:
-            x = int(lm.x * width)
-            y = int(lm.y * height)
-            vis = getattr(lm, "visibility", 1.0)
-            points.append((x, y, vis))
-            if vis >= self._visibility_threshold:
-                cv2.circle(annotated, (x, y), 4, (0, 255, 0), -1)
-
-        for start, end in POSE_CONNECTIONS:
-            x1, y1, v1 = points[start]
-            x2, y2, v2 = points[end]
-            if v1 >= self._visibility_threshold and v2 >= self._visibility_threshold:
-                cv2.line(annotated, (x1, y1), (x2, y2), (0, 255, 255), 2)
+        points = (pose_landmarks[:, :2] * (width, height)).astype(np.int32)
+        visible = pose_landmarks[:, 2] >= self._visibility_threshold
+
+        for x, y in points[visible].tolist():
+            cv2.circle(annotated, (x, y), 4, (0, 255, 0), -1)
+
+        edges = _CONNECTION_INDEX[visible[_CONNECTION_INDEX].all(axis=1)]
+        if len(edges):
+            cv2.polylines(annotated, list(points[edges]), False, (0, 255, 255), 2)
         return annotated
 
-    def _movement_metric(
-        self, world_landmarks: np.ndarray, visibility_mask: np.ndarray
-    ) -> Tuple[float, bool]:
-        landmarks = world_landmarks.copy()
-        landmarks[~visibility_mask] = np.nan
-        if self._prev_world_landmarks is None:
-            self._prev_world_landmarks = landmarks
-            return 0.0, False
-        prev = self._prev_world_landmarks
-        valid = visibility_mask & np.isfinite(prev[:, 0])
-        if not np.any(valid):
-            self._prev_world_landmarks = landmarks
-            return 0.0, False
-        diffs = np.linalg.norm(landmarks[valid] - prev[valid], axis=1)
-        score = float(np.mean(diffs))
-        self._prev_world_landmarks = landmarks
+    def _movement_metric(self, landmarks: np.ndarray, timestamp_ms: int) -> Tuple[float, bool]:
+        # The displacement is divided by the time between the two frames so
+        # the score (and the threshold, in m/s) does not depend on how many
+        # frames are analysed per second or on dropped frames.
+        score = 0.0
+        if self._has_prev_landmarks:
+            displacement = geometry.movement_score(
+                landmarks, self._prev_landmarks, self._visibility_threshold
+            )
+            score = displacement * 1000.0 / (timestamp_ms - self._prev_landmarks_ms)
+        self._prev_landmarks[:] = landmarks
+        self._prev_landmarks_ms = timestamp_ms
+        self._has_prev_landmarks = True
         return score, score > self._movement_threshold
 
-    def _torso_vector(self, world_landmarks: np.ndarray) -> np.ndarray:
-        left_shoulder = world_landmarks[LEFT_SHOULDER]
-        right_shoulder = world_landmarks[RIGHT_SHOULDER]
-        left_hip = world_landmarks[LEFT_HIP]
-        right_hip = world_landmarks[RIGHT_HIP]
-        shoulder_center = (left_shoulder + right_shoulder) / 2.0
-        hip_center = (left_hip + right_hip) / 2.0
-        return shoulder_center - hip_center
-
-    def _angle_with_vertical(self, vector: np.ndarray) -> float:
-        vertical = np.array([0.0, -1.0, 0.0], dtype=np.float32)
-        norm_v = np.linalg.norm(vector)
-        if norm_v < 1e-6:
-            return 90.0
-        cos_theta = np.dot(vector, vertical) / (norm_v * np.linalg.norm(vertical))
-        cos_theta = float(np.clip(cos_theta, -1.0, 1.0))
-        return math.degrees(math.acos(cos_theta))
-
     def _smooth_angle(self, current_angle: float) -> float:
         if self._previous_angle is None:
             self._previous_angle = current_angle
         else:
             self._previous_angle = (
                 self._angle_smoothing * self._previous_angle
-                + (1.0 - self._angle_smoothing) * current_angle
+                + self._angle_blend * current_angle
             )
         return self._previous_angle
 
-    def _classify_posture(
-        self,
-        angle_deg: float,
-        forward_component: float,
-        avg_knee_angle: Optional[float],
-        leg_extension: Optional[float],
-        leg_span: Optional[float],
-        knee_span: Optional[float],
-    ) -> str:
-        lying_forward_threshold = self._lying_forward_ratio + 0.08
-        lying_angle_threshold = self._lying_angle + 5.0
-        if angle_deg >= lying_angle_threshold or forward_component >= lying_forward_threshold:
-            return "lying"
-
-        standing_score = 0
-        sitting_score = 0
-
-        if avg_knee_angle is not None:
-            if avg_knee_angle >= self._standing_knee_angle:
-                standing_score += 1
-            if self._sitting_knee_min <= avg_knee_angle <= self._sitting_knee_max:
-                sitting_score += 1
-
-        if leg_extension is not None:
-            if leg_extension >= self._standing_leg_extension_min:
-                standing_score += 1
-            if leg_extension <= self._sitting_leg_extension_max:
-                sitting_score += 1
-
-        if leg_span is not None:
-            if leg_span >= 0.22:
-                standing_score += 1
-            if leg_span < 0.18:
-                sitting_score += 1
-
-        if knee_span is not None:
-            if knee_span >= 0.12:
-                standing_score += 1
-            if knee_span < 0.10:
-                sitting_score += 1
-
-        if angle_deg <= (self._standing_angle + 5.0) and forward_component <= (self._standing_forward_ratio + 0.05):
-            standing_score += 1
-        elif angle_deg <= (self._lying_angle + 8.0):
-            sitting_score += 1
-
-        if standing_score >= max(sitting_score, 2):
-            return "standing"
-        if sitting_score >= max(standing_score, 2):
-            return "sitting"
-        # fallback heuristics
-        if angle_deg <= (self._lying_angle + 8.0):
-            return "sitting"
-        if angle_deg <= (self._standing_angle + 6.0):
-            return "standing"
-        return "lying"
-
-    def _compute_knee_angles(
-        self, world_landmarks: np.ndarray, visibility_mask: np.ndarray
-    ) -> Tuple[Optional[float], Optional[float], Optional[float]]:
-        left = right = None
-        if self._landmarks_visible(visibility_mask, (LEFT_HIP, LEFT_KNEE, LEFT_ANKLE)):
-            left = self._joint_angle(
-                world_landmarks[LEFT_HIP],
-                world_landmarks[LEFT_KNEE],
-                world_landmarks[LEFT_ANKLE],
+    def _create_landmarker(self) -> PoseLandmarker:
+        mp = self._mp
+        # The coarse posture rules do not need the full model's accuracy, so
+        # CPU inference defaults to the lighter and faster lite variant.
+        variant = os.getenv("POSE_MODEL_VARIANT")
+        if variant is not None and variant not in MODEL_VARIANTS:
+            raise ValueError(
+                f"POSE_MODEL_VARIANT must be one of {', '.join(MODEL_VARIANTS)}, got {variant!r}"
             )
-        if self._landmarks_visible(visibility_mask, (RIGHT_HIP, RIGHT_KNEE, RIGHT_ANKLE)):
-            right = self._joint_angle(
-                world_landmarks[RIGHT_HIP],
-                world_landmarks[RIGHT_KNEE],
-                world_landmarks[RIGHT_ANKLE],
+        if os.getenv("POSE_GPU", "1") == "1" and _gpu_device_present():
+            # Resolved outside the try: a download error is not a GPU failure.
+            options = self._landmarker_options(
+                self._ensure_model(variant or "full"), mp.BaseOptions.Delegate.GPU
             )
-        available = [angle for angle in (left, right) if angle is not None]
-        avg = float(np.mean(available)) if available else None
-        return avg, left, right
-
-    def _joint_angle(self, a: np.ndarray, b: np.ndarray, c: np.ndarray) -> float:
-        ba = a - b
-        bc = c - b
-        norm_ba = np.linalg.norm(ba)
-        norm_bc = np.linalg.norm(bc)
-        if norm_ba < 1e-6 or norm_bc < 1e-6:
-            return 0.0
-        cos_angle = np.dot(ba, bc) / (norm_ba * norm_bc)
-        cos_angle = float(np.clip(cos_angle, -1.0, 1.0))
-        return math.degrees(math.acos(cos_angle))
-
-    def _leg_extension(self, pose_landmarks) -> Optional[float]:
-        left_hip = pose_landmarks[LEFT_HIP]
-        right_hip = pose_landmarks[RIGHT_HIP]
-        left_ankle = pose_landmarks[LEFT_ANKLE]
-        right_ankle = pose_landmarks[RIGHT_ANKLE]
-        hips = [lm for lm in (left_hip, right_hip) if lm.visibility >= self._visibility_threshold]
-        ankles = [lm for lm in (left_ankle, right_ankle) if lm.visibility >= self._visibility_threshold]
-        if not hips or not ankles:
-            return None
-        hip_y = np.mean([lm.y for lm in hips])
-        ankle_y = np.mean([lm.y for lm in ankles])
-        return float(ankle_y - hip_y)
-
-    def _landmarks_visible(
-        self, visibility_mask: np.ndarray, indices: Tuple[int, ...]
-    ) -> bool:
-        return all(visibility_mask[idx] for idx in indices)
-
-    def _mean_y(self, pose_landmarks, indices: list[int]) -> Optional[float]:
-        values = []
-        for idx in indices:
-            lm = pose_landmarks[idx]
-            vis = getattr(lm, "visibility", 1.0)
-            if vis >= self._visibility_threshold:
-                values.append(lm.y)
-        if not values:
-            return None
-        return float(np.mean(values))
+            try:
+                return mp.PoseLandmarker.create_from_options(options)
+            except (RuntimeError, NotImplementedError) as exc:
+                logging.warning("GPU delegate unavailable (%s), using CPU inference", exc)
+        return mp.PoseLandmarker.create_from_options(
+            self._landmarker_options(
+                self._ensure_model(variant or "lite"),
+                mp.BaseOptions.Delegate.CPU,
+            )
+        )
+
+    def _landmarker_options(self, model_path: Path, delegate) -> PoseLandmarkerOptions:
+        mp = self._mp
+        return mp.PoseLandmarkerOptions(
+            base_options=mp.BaseOptions(
+                model_asset_path=str(model_path), delegate=delegate
+            ),
+            # VIDEO mode tracks the pose from the previous frame and only
+            # re-runs the person detector when tracking is lost.
+            running_mode=mp.RunningMode.VIDEO,
+            min_pose_detection_confidence=0.5,
+            min_pose_presence_confidence=0.5,
+            min_tracking_confidence=0.5,
+        )
 
-    def _ensure_model(self) -> Path:
+    def _ensure_model(self, variant: str) -> Path:
         override = os.getenv("POSE_MODEL_PATH")
         if override:
             return Path(override)
-        models_dir = Path(__file__).resolve().parents[1] / "models"
-        models_dir.mkdir(parents=True, exist_ok=True)
-        model_path = models_dir / MODEL_NAME
-        if not model_path.exists():
-            try:
-                urllib.request.urlretrieve(MODEL_URL, model_path)
-            except Exception as exc:
-                raise RuntimeError(
-                    "Unable to download pose landmarker model. "
-                    "Set POSE_MODEL_PATH to a local .task file."
-                ) from exc
-        return model_path
+        return _resolve_model_path(variant)
 
     def _invalidate_state(self) -> None:
         self._previous_angle = None
-        self._prev_world_landmarks = None
+        self._has_prev_landmarks = False
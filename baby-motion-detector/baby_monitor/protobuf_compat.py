@@ -5,9 +5,11 @@ from __future__ import annotations
 from google.protobuf import message_factory, symbol_database
 
 
-if not getattr(symbol_database, "_patched_get_prototype", False):
+# Recent protobuf releases dropped SymbolDatabase.GetPrototype, which older
+# MediaPipe code still calls. Older releases keep their own implementation
+# (and may predate GetMessageClass), so they are left untouched.
+if not hasattr(symbol_database.SymbolDatabase, "GetPrototype"):
     def _get_message_class(self, descriptor):
         return message_factory.GetMessageClass(descriptor)
 
     symbol_database.SymbolDatabase.GetPrototype = _get_message_class
-    symbol_database._patched_get_prototype = True
@@ -1,8 +1,10 @@
 from __future__ import annotations
 
 import asyncio
+import atexit
 import logging
 import os
+import re
 import signal
 import sys
 import threading
@@ -26,23 +28,42 @@ def _install_stderr_filter(blocked_phrases: Sequence[str]) -> None:
     if getattr(_install_stderr_filter, "_installed", False):
         return
 
-    blocked = tuple(phrase.encode("utf-8") for phrase in blocked_phrases)
+    # One alternation scans each line for every phrase in a single pass.
+    blocked = re.compile(b"|".join(re.escape(phrase.encode("utf-8")) for phrase in blocked_phrases))
     read_fd, write_fd = os.pipe()
     original_fd = os.dup(2)
     os.dup2(write_fd, 2)
     os.close(write_fd)
 
+    def _forward(lines: list[bytes]) -> None:
+        kept = [line for line in lines if not blocked.search(line)]
+        if kept:
+            os.write(original_fd, b"".join(kept))
+
+    # A dedicated thread drains the pipe so a stalled or finished event loop
+    # (which logs into this very pipe) can never fill it up.
     def _pump() -> None:
-        with os.fdopen(read_fd, "rb", closefd=True) as reader, os.fdopen(
-            original_fd, "wb", buffering=0, closefd=False
-        ) as target:
-            for chunk in iter(reader.readline, b""):
-                if any(phrase in chunk for phrase in blocked):
-                    continue
-                target.write(chunk)
-                target.flush()
-
-    threading.Thread(target=_pump, daemon=True).start()
+        pending = b""
+        while chunk := os.read(read_fd, 65536):
+            lines = (pending + chunk).split(b"\n")
+            # The last element is an incomplete line (or empty): keep it.
+            pending = lines.pop()
+            _forward([line + b"\n" for line in lines])
+        if pending:
+            _forward([pending])
+        os.close(read_fd)
+
+    pump = threading.Thread(target=_pump, name="stderr-filter", daemon=True)
+    pump.start()
+
+    def _restore() -> None:
+        # Point fd 2 back at the real stderr: the pipe then reaches EOF once
+        # other holders (pose worker) exit, and the pump flushes what is left,
+        # including a final traceback.
+        os.dup2(original_fd, 2)
+        pump.join(timeout=1.0)
+
+    atexit.register(_restore)
     _install_stderr_filter._installed = True
 
 
@@ -100,5 +121,17 @@ async def _run() -> None:
     await run_task
 
 
+def _install_event_loop_policy() -> None:
+    """Use uvloop when available (not supported on Windows)."""
+    if sys.platform == "win32":
+        return
+    try:
+        import uvloop
+    except ImportError:
+        return
+    uvloop.install()
+
+
 if __name__ == "__main__":
+    _install_event_loop_policy()
     asyncio.run(_run())
@@ -0,0 +1,149 @@
+import unittest
+from types import SimpleNamespace
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+from baby_monitor.audio import AudioAnalyzer, CryDetector
+
+# Largest accepted gap between the decimated band ratio and the ratio of a
+# full-rate Welch spectrum (fraction of the total power).
+RATIO_TOLERANCE = 0.01
+
+
+def _reference_ratio(window: np.ndarray, sample_rate: int, nperseg: int) -> float:
+    """Cry-band power ratio of a full-rate Welch spectrum (scipy's defaults)."""
+    step = nperseg - nperseg // 2
+    hann = 0.5 - 0.5 * np.cos(2.0 * np.pi * np.arange(nperseg) / nperseg)
+    segments = sliding_window_view(window.astype(np.float64), nperseg)[::step]
+    segments = (segments - segments.mean(axis=1, keepdims=True)) * hann
+    power = np.mean(np.abs(np.fft.rfft(segments, axis=1)) ** 2, axis=0)
+    power[1 : (nperseg + 1) // 2] *= 2.0
+    freqs = np.fft.rfftfreq(nperseg, d=1.0 / sample_rate)
+    band = (freqs >= 400.0) & (freqs <= 1500.0)
+    return float(power[band].sum() / power.sum())
+
+
+def _signals(sample_rate: int, size: int):
+    rng = np.random.default_rng(0)
+    t = np.arange(size) / sample_rate
+    yield "noise", rng.normal(size=size) * 0.3
+    for freq in (450.0, 800.0, 1400.0, 3000.0):
+        yield f"tone {freq:.0f} Hz", np.sin(2 * np.pi * freq * t) + 0.1 * rng.normal(size=size)
+    yield "modulated", np.sin(2 * np.pi * 1000 * t) * (1 + np.sin(2 * np.pi * 3 * t))
+    yield "offset", 0.2 * rng.normal(size=size) + 0.5 * np.sin(2 * np.pi * 1200 * t) + 0.3
+    # Folds onto 1000 Hz after decimation unless the low-pass removes it.
+    yield "alias", np.sin(2 * np.pi * (sample_rate / 2 - 1000) * t)
+
+
+class CryDetectorSpectrumTest(unittest.TestCase):
+    def test_band_ratio_tracks_full_rate_welch(self):
+        for sample_rate in (48000, 44100, 16000, 8000):
+            detector = CryDetector(sample_rate)
+            for name, signal in _signals(sample_rate, detector.window_size):
+                window = signal.astype(np.float32)[np.newaxis]
+                with self.subTest(sample_rate=sample_rate, signal=name):
+                    band = detector._band_power(window[0], np.array([0]))
+                    total = detector._total_power(window)
+                    expected = _reference_ratio(window[0], sample_rate, detector._nperseg)
+                    self.assertAlmostEqual(
+                        float(band[0] / total[0]), expected, delta=RATIO_TOLERANCE
+                    )
+
+    def test_band_ratio_is_clamped_to_one(self):
+        for sample_rate in (48000, 44100, 16000):
+            detector = CryDetector(sample_rate)
+            t = np.arange(detector.window_size) / sample_rate
+            for freq in (600.0, 1000.0, 1400.0):
+                tone = np.sin(2 * np.pi * freq * t).astype(np.float32)
+                with self.subTest(sample_rate=sample_rate, freq=freq):
+                    index, event = detector._detect(tone)
+                    self.assertEqual(index, 0)
+                    self.assertLessEqual(event.ratio_mid_band, 1.0)
+
+
+class CryDetectorBatchTest(unittest.TestCase):
+    def _feed_serially(self, detector, samples):
+        """Feed one window, then one hop at a time, until an event fires."""
+        position = detector.window_size
+        event = detector.process_samples(samples[:position])
+        while event is None and position < samples.size:
+            event = detector.process_samples(samples[position : position + detector.hop_size])
+            position += detector.hop_size
+        return event, samples[position:]
+
+    def _assert_batch_matches_serial(self, samples, sample_rate):
+        batch = CryDetector(sample_rate)
+        serial = CryDetector(sample_rate)
+        batch_event = batch.process_samples(samples)
+        serial_event, unfed = self._feed_serially(serial, samples)
+
+        self.assertEqual(batch_event is None, serial_event is None)
+        if batch_event is not None:
+            self.assertAlmostEqual(batch_event.energy, serial_event.energy, places=6)
+            self.assertAlmostEqual(
+                batch_event.ratio_mid_band, serial_event.ratio_mid_band, places=6
+            )
+        # Batch leftovers are the serial buffer plus what was never fed to it.
+        self.assertEqual(batch._fill, serial._fill + unfed.size)
+        np.testing.assert_array_equal(
+            batch._buffer[: batch._fill],
+            np.concatenate([serial._buffer[: serial._fill], unfed]),
+        )
+
+    def test_burst_with_cry_after_silence(self):
+        for sample_rate in (48000, 16000):
+            rng = np.random.default_rng(1)
+            size = sample_rate * 10 + 123
+            samples = 0.01 * rng.normal(size=size)
+            t = np.arange(size) / sample_rate
+            cry = (t >= 4.2) & (t < 7.5)
+            samples[cry] += 0.5 * np.sin(2 * np.pi * 900 * t[cry])
+            with self.subTest(sample_rate=sample_rate):
+                self._assert_batch_matches_serial(samples.astype(np.float32), sample_rate)
+
+    def test_burst_without_cry(self):
+        rng = np.random.default_rng(2)
+        samples = (0.3 * rng.normal(size=48000 * 6)).astype(np.float32)
+        self._assert_batch_matches_serial(samples, 48000)
+
+
+class _FakeFrame:
+    """The parts of ``av.AudioFrame`` that ``AudioAnalyzer`` downmixes from."""
+
+    def __init__(self, array: np.ndarray, planar: bool, channels: int) -> None:
+        self._array = array
+        self.format = SimpleNamespace(is_planar=planar)
+        self.layout = SimpleNamespace(channels=[object()] * channels)
+
+    def to_ndarray(self) -> np.ndarray:
+        return self._array
+
+
+class AudioAnalyzerDownmixTest(unittest.TestCase):
+    def setUp(self):
+        self.left = np.array([-1, 0, 1, 3, 32767, -32768, 100, -7], dtype=np.int16)
+        self.right = np.array([0, 0, 2, 4, 32767, -32768, -100, -8], dtype=np.int16)
+        # Halves round up: -0.5 -> 0, 1.5 -> 2, -7.5 -> -7
+        self.expected = np.array([0, 0, 2, 4, 32767, -32768, 0, -7], dtype=np.int16)
+        self.analyzer = AudioAnalyzer("unused")
+
+    def test_packed_stereo(self):
+        interleaved = np.stack([self.left, self.right], axis=1).reshape(1, -1)
+        pcm = self.analyzer._mono_pcm(_FakeFrame(interleaved, planar=False, channels=2))
+        self.assertEqual(pcm.dtype, np.int16)
+        np.testing.assert_array_equal(pcm, self.expected)
+
+    def test_planar_stereo(self):
+        planar = np.stack([self.left, self.right])
+        pcm = self.analyzer._mono_pcm(_FakeFrame(planar, planar=True, channels=2))
+        self.assertEqual(pcm.dtype, np.int16)
+        np.testing.assert_array_equal(pcm, self.expected)
+
+    def test_mono_is_passed_through(self):
+        pcm = self.analyzer._mono_pcm(_FakeFrame(self.left[np.newaxis], planar=False, channels=1))
+        np.testing.assert_array_equal(pcm, self.left)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -105,15 +105,24 @@
             sender.setParameters(params).catch(() => {});
           }
         });
+      // Candidates are gathered in bursts: coalesce those found within
+      // 20 ms into a single signaling message.
+      const pendingCandidates = [];
+      let flushTimer = null;
       pc.onicecandidate = (e) => {
-        if (e.candidate)
+        if (!e.candidate) return;
+        pendingCandidates.push(e.candidate);
+        if (flushTimer) return;
+        flushTimer = setTimeout(() => {
+          flushTimer = null;
           this.ws.send(
             JSON.stringify({
-              type: "candidate",
+              type: "candidates",
               targetId: viewerId,
-              candidate: e.candidate,
+              candidates: pendingCandidates.splice(0),
             })
           );
+        }, 20);
       };
       pc.onconnectionstatechange = () => {
         if (["failed", "disconnected", "closed"].includes(pc.connectionState)) {
@@ -182,6 +191,12 @@
           this.pc
             .addIceCandidate(new RTCIceCandidate(msg.candidate))
             .catch(() => {});
+      } else if (msg.type === "candidates") {
+        (msg.candidates || []).forEach((candidate) =>
+          this.pc
+            .addIceCandidate(new RTCIceCandidate(candidate))
+            .catch(() => {})
+        );
       }
     }
   }
@@ -58,7 +58,12 @@ wss.on("connection", (ws) => {
       return;
     }
 
-    if (type === "offer" || type === "answer" || type === "candidate") {
+    if (
+      type === "offer" ||
+      type === "answer" ||
+      type === "candidate" ||
+      type === "candidates"
+    ) {
       const r = getRoom(ws.meta.room);
       if (!r) return;
       const targets = new Set();